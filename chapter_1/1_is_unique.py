@@ -1,6 +1,11 @@
+import io
+import sys
+import time
 import unittest
 
-from data_structures.arrays_and_strings.array_sorting import quick_sort
+# Sizes of the bounded alphabets that a bitmap, or counting sort, is used for
+ASCII_ALPHABET_SIZE = 128
+LATIN_1_ALPHABET_SIZE = 256
 
 
 def is_unique(input_string):
@@ -35,12 +40,94 @@ def is_unique(input_string):
     return True
 
 
+def _counting_sort(char_codes):
+    """Sort Latin-1 char codes in place, using a counting sort.
+
+    O(n) time, and only needs a fixed-size array of counts (one per char in
+    the alphabet), however the chars are ordered to begin with.
+
+    Parameters
+    ----------
+    char_codes : bytearray
+        Char codes to sort
+    """
+    # Count occurrences of each char code
+    counts = [0] * LATIN_1_ALPHABET_SIZE
+    for code in char_codes:
+        counts[code] += 1
+
+    # Overwrite char_codes with each char code, repeated count times, in order
+    index = 0
+    for code, count in enumerate(counts):
+        if count:
+            char_codes[index: index + count] = bytes((code,)) * count
+            index += count
+
+
+def _sift_down(array, start_index, end_index):
+    """Move element at start_index down a max heap, stored in
+    array[:end_index], until it is larger than both of its children.
+
+    Parameters
+    ----------
+    array : list of any
+        Array storing heap. Can contain any Python object that allows
+        comparison.
+    start_index : int
+        Index of element to move down heap
+    end_index : int
+        Index in array denoting end of heap (exclusive)
+    """
+    root_index = start_index
+    # Keep going while root has at least one child
+    while 2 * root_index + 1 < end_index:
+        # Find index of largest child
+        child_index = 2 * root_index + 1
+        if (child_index + 1 < end_index and
+                array[child_index] < array[child_index + 1]):
+            child_index += 1
+
+        # Stop once root is larger than both children
+        if not array[root_index] < array[child_index]:
+            return
+
+        array[root_index], array[child_index] = (
+            array[child_index], array[root_index]
+        )
+        root_index = child_index
+
+
+def _heap_sort(array):
+    """Sort array in place, using a heap sort.
+
+    O(n log n) time in the worst case, with O(1) extra space, unlike quick
+    sort, which is O(n^2) time on already sorted input.
+
+    Parameters
+    ----------
+    array : list of any
+        Array to sort. Can contain any Python object that allows comparison.
+    """
+    # Rearrange array into a max heap
+    for start_index in range(len(array) // 2 - 1, -1, -1):
+        _sift_down(array, start_index, len(array))
+
+    # Repeatedly move max element of heap to end of array, then shrink heap
+    for end_index in range(len(array) - 1, 0, -1):
+        array[0], array[end_index] = array[end_index], array[0]
+        _sift_down(array, 0, end_index)
+
+
 def is_unique_v2(input_string):
     """Find out if input_string has all unique characters, or not.
 
     Cannot use additional data structures (constraint of problem), therefore
     sorts array, then checks for duplicate adjacent elements.
 
+    If all chars are Latin-1 (i.e. a bounded alphabet), they are sorted as a
+    bytearray using a counting sort, in O(n) time. Otherwise, falls back to a
+    heap sort, which is O(n log n) time even on adversarial input.
+
     Parameters
     ----------
     input_string : str
@@ -55,18 +142,241 @@ def is_unique_v2(input_string):
     if len(input_string) == 0:
         return True
 
-    sorted_input_string = ''.join(quick_sort(list(input_string)))
+    if max(input_string) <= '\xff':
+        chars = bytearray(input_string, 'latin-1')
+        _counting_sort(chars)
+    else:
+        chars = list(input_string)
+        _heap_sort(chars)
 
-    # Iterate through chars in sorted string, checking for duplicate adjacent
-    # chars
-    for i, char in enumerate(sorted_input_string[:-1]):
+    # Iterate through sorted chars, checking for duplicate adjacent chars
+    for i in range(len(chars) - 1):
         # Compare elements i and i+1
-        if char == sorted_input_string[i+1]:
+        if chars[i] == chars[i + 1]:
             return False
 
     return True
 
 
+def _alphabet_size(input_string):
+    """Find size of the smallest bounded alphabet that input_string is in
+
+    Parameters
+    ----------
+    input_string : str or bytes
+        String to find alphabet of
+
+    Returns
+    -------
+    int
+        ASCII_ALPHABET_SIZE or LATIN_1_ALPHABET_SIZE, or None if input_string
+        has chars outside Latin-1
+    """
+    if isinstance(input_string, (bytes, bytearray)):
+        return LATIN_1_ALPHABET_SIZE
+    if input_string.isascii():
+        return ASCII_ALPHABET_SIZE
+    if max(input_string) <= '\xff':
+        return LATIN_1_ALPHABET_SIZE
+    return None
+
+
+def is_unique_batch(input_strings):
+    """Find out if each string in input_strings has all unique characters, or
+    not.
+
+    Intended for streaming through large numbers of strings: results are
+    yielded one at a time, so input_strings can be any iterable (e.g. a file
+    object), and is never held in memory all at once.
+
+    Strings in a bounded alphabet (ASCII/Latin-1 strings, and bytes) that are
+    longer than the alphabet must contain a duplicate (pigeonhole principle),
+    so these return False without building anything. Otherwise, a string is
+    unique if the set of its chars is as long as it; building the set is
+    done in C, so is much faster per string than a Python loop over its
+    chars.
+
+    Parameters
+    ----------
+    input_strings : iterable of str or bytes
+        Strings to check for uniqueness
+
+    Yields
+    ------
+    bool
+        True if string is unique, False otherwise, for each string in
+        input_strings
+    """
+    for input_string in input_strings:
+        length = len(input_string)
+
+        # Only strings longer than ASCII alphabet can break pigeonhole, so
+        # only find alphabet of these
+        if length > ASCII_ALPHABET_SIZE:
+            alphabet_size = _alphabet_size(input_string)
+            if alphabet_size is not None and length > alphabet_size:
+                yield False
+                continue
+
+        yield len(set(input_string)) == length
+
+
+# No. of chars to read from a text stream at a time, in first_duplicate
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def first_duplicate(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Find first char in a stream that is a repeat of an earlier char.
+
+    Stops reading from stream as soon as a duplicate is found, so works on
+    streams of any length. Bytes, and chars in Latin-1, are checked with a
+    fixed-size bitmap. Byte streams are read at most LATIN_1_ALPHABET_SIZE + 1
+    bytes at a time, since a duplicate must have been found by then. Text
+    streams have an unbounded alphabet, so chars outside Latin-1 are stored
+    in a set, which stays empty if the text is ASCII/Latin-1.
+
+    Parameters
+    ----------
+    stream : file-like
+        Stream to search. Any object with a read(size) method, returning bytes
+        or str.
+    chunk_size : int
+        Max no. of chars to read from a text stream at a time
+
+    Returns
+    -------
+    tuple
+        (offset, char, num_read): offset is index in stream of first
+        duplicate char, char is the duplicate char (or byte), and num_read is
+        no. of chars (or bytes, for a byte stream) read from stream. A text
+        stream doesn't expose how many bytes it has decoded, so offset and
+        num_read of text streams count chars. offset and char are None if
+        stream has no duplicates.
+    """
+    # Read first chunk, to find out if stream is a byte stream or text stream
+    chunk = stream.read(LATIN_1_ALPHABET_SIZE + 1)
+    num_read = 0
+
+    # Entry i of bitmap is set once the byte (or char) with code i has been
+    # found
+    bitmap = bytearray(LATIN_1_ALPHABET_SIZE)
+
+    if isinstance(chunk, str):
+        # Initialise set to contain chars outside Latin-1 already found
+        other_chars_found = set()
+        while chunk:
+            for i, char in enumerate(chunk):
+                code = ord(char)
+                if code < LATIN_1_ALPHABET_SIZE:
+                    if bitmap[code]:
+                        return num_read + i, char, num_read + len(chunk)
+                    bitmap[code] = 1
+                elif char in other_chars_found:
+                    return num_read + i, char, num_read + len(chunk)
+                else:
+                    other_chars_found.add(char)
+
+            num_read += len(chunk)
+            chunk = stream.read(chunk_size)
+    else:
+        while chunk:
+            for i, code in enumerate(chunk):
+                if bitmap[code]:
+                    return num_read + i, bytes((code,)), num_read + len(chunk)
+                bitmap[code] = 1
+
+            num_read += len(chunk)
+            chunk = stream.read(LATIN_1_ALPHABET_SIZE + 1)
+
+    return None, None, num_read
+
+
+def benchmark_is_unique_batch(num_strings=1000000):
+    """Print strings per second processed by is_unique_batch, compared with
+    calling is_unique on each string.
+
+    Parameters
+    ----------
+    num_strings : int
+        No. of strings to check in each workload
+    """
+    workloads = {
+        # Short, mostly unique, identifier-like strings
+        'identifiers': ['id_{}'.format(i) for i in range(num_strings)],
+        # Long lines of text, which can't be unique
+        'long lines': [
+            'line {} of a long log file. '.format(i) * 10
+            for i in range(num_strings // 10)
+        ],
+    }
+
+    for name, input_strings in workloads.items():
+        start = time.perf_counter()
+        for input_string in input_strings:
+            is_unique(input_string)
+        dict_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in is_unique_batch(input_strings):
+            pass
+        batch_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for input_string in input_strings:
+            len(set(input_string)) == len(input_string)
+        set_time = time.perf_counter() - start
+
+        print('{} ({:,} strings)'.format(name, len(input_strings)))
+        print('    is_unique:       {:,.0f} strings/s'.format(
+            len(input_strings) / dict_time
+        ))
+        print('    is_unique_batch: {:,.0f} strings/s'.format(
+            len(input_strings) / batch_time
+        ))
+        print('    len(set(s)):     {:,.0f} strings/s'.format(
+            len(input_strings) / set_time
+        ))
+
+
+def benchmark_is_unique_v2(sizes=(1000, 2000, 4000)):
+    """Print time taken by is_unique_v2 on worst case inputs, compared with
+    sorting using quick_sort (the previous implementation).
+
+    Parameters
+    ----------
+    sizes : iterable of int
+        Lengths of input strings to time. Doubling size shows how each
+        implementation scales.
+    """
+    from data_structures.arrays_and_strings.array_sorting import quick_sort
+
+    workloads = {
+        'already sorted (Latin-1)': lambda n: ''.join(
+            chr(i * LATIN_1_ALPHABET_SIZE // n) for i in range(n)
+        ),
+        'repeated char': lambda n: 'a' * n,
+        'already sorted (CJK)': lambda n: ''.join(
+            chr(0x4e00 + i) for i in range(n)
+        ),
+    }
+
+    for name, make_input in workloads.items():
+        print(name)
+        for size in sizes:
+            input_string = make_input(size)
+
+            start = time.perf_counter()
+            quick_sort(list(input_string))
+            quick_sort_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            is_unique_v2(input_string)
+            v2_time = time.perf_counter() - start
+
+            print('    n={:,}: quick_sort {:.4f}s, is_unique_v2 {:.4f}s'
+                  .format(size, quick_sort_time, v2_time))
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -75,7 +385,9 @@ class Test(unittest.TestCase):
         ('golfer GO', True),  # check case sensitivity
         ('python programmer', False),
         ('', True),
-        ('  ', False)
+        ('  ', False),
+        ('\u03c0\u03c1\u03c3', True),  # check chars outside Latin-1
+        ('\u03c0\u03c1\u03c0', False)
     ]
 
     def test_is_unique(self):
@@ -86,7 +398,75 @@ class Test(unittest.TestCase):
         for test_input, test_output in self.data:
             self.assertEqual(is_unique_v2(test_input), test_output)
 
+    def test_sorts(self):
+        char_codes = bytearray(b'python programmer')
+        _counting_sort(char_codes)
+        self.assertEqual(char_codes, bytearray(sorted(b'python programmer')))
+
+        array = list('python programmer')
+        _heap_sort(array)
+        self.assertEqual(array, sorted('python programmer'))
+
+    def test_is_unique_batch(self):
+        test_inputs = [test_input for test_input, _ in self.data]
+        test_outputs = [test_output for _, test_output in self.data]
+        self.assertEqual(list(is_unique_batch(test_inputs)), test_outputs)
+
+        # Test Latin-1, non-Latin-1 and bytes inputs
+        self.assertEqual(
+            list(is_unique_batch(['caf\xe9', '\xe9t\xe9', '\u03c0\u03c1',
+                                  '\u03c0\u03c0', b'abc', b'abca'])),
+            [True, False, True, False, True, False]
+        )
+
+        # Test strings longer than the alphabet exit early
+        too_long_string = ''.join(chr(i % 128) for i in range(129))
+        self.assertEqual(list(is_unique_batch([too_long_string])), [False])
+        self.assertEqual(list(is_unique_batch([bytes(257)])), [False])
+
+        # Test long strings that can't exit early
+        latin_1_string = ''.join(chr(i) for i in range(256))
+        cjk_string = ''.join(chr(0x4e00 + i) for i in range(300))
+        self.assertEqual(
+            list(is_unique_batch([latin_1_string, cjk_string,
+                                  cjk_string + '\u4e00'])),
+            [True, True, False]
+        )
+
+    def test_first_duplicate(self):
+        for test_input, test_output in self.data:
+            offset, char, _ = first_duplicate(io.StringIO(test_input))
+            self.assertEqual(offset is None, test_output)
+
+        # Test offset, char and no. of chars read, across chunks
+        stream = io.StringIO('python programmer')
+        self.assertEqual(first_duplicate(stream), (7, 'p', 17))
+        cjk_chars = ''.join(chr(0x4e00 + i) for i in range(300))
+        stream = io.StringIO(cjk_chars + '\u4e00' + 'x' * 100)
+        self.assertEqual(
+            first_duplicate(stream, chunk_size=10), (300, '\u4e00', 307)
+        )
+
+        stream = io.StringIO('caf\xe9 \u03c0\u03c1 \xe9')
+        self.assertEqual(first_duplicate(stream), (7, ' ', 9))
+        stream = io.StringIO('caf\xe9 \u03c0\u03c1\u03c0')
+        self.assertEqual(first_duplicate(stream), (7, '\u03c0', 8))
+        stream = io.StringIO('abcdefghij' * 100)
+        self.assertEqual(first_duplicate(stream), (10, 'a', 257))
+        self.assertEqual(first_duplicate(io.StringIO('golfer')),
+                         (None, None, 6))
+
+        # Test byte stream never reads more than alphabet size + 1 bytes
+        stream = io.BytesIO(bytes(range(256)) * 100)
+        self.assertEqual(first_duplicate(stream), (256, b'\x00', 257))
+        self.assertEqual(first_duplicate(io.BytesIO(b'abca')), (3, b'a', 4))
+        self.assertEqual(first_duplicate(io.BytesIO(b'')), (None, None, 0))
+
 
 if __name__ == '__main__':
 
-    unittest.main()
+    if '--benchmark' in sys.argv:
+        benchmark_is_unique_batch()
+        benchmark_is_unique_v2()
+    else:
+        unittest.main()
@@ -1,3 +1,8 @@
+import collections
+import io
+import mmap
+import os
+import tempfile
 import unittest
 
 
@@ -57,6 +62,271 @@ def is_permutation(str_1, str_2):
         return False
 
 
+def _update_count_diff(count_diffs, char, change):
+    """Add change to count difference of char, in a histogram of differences
+    between two sets of value counts.
+
+    Parameters
+    ----------
+    count_diffs : dict
+        Keys are chars; values are differences in counts of char
+    char : str
+        Char to update count difference of
+    change : int
+        Amount to add to count difference
+
+    Returns
+    -------
+    int
+        Change in no. of chars with non-zero count difference; one of -1, 0, 1
+    """
+    old_count_diff = count_diffs.get(char, 0)
+    new_count_diff = old_count_diff + change
+    count_diffs[char] = new_count_diff
+
+    if old_count_diff == 0:
+        return 1
+    if new_count_diff == 0:
+        return -1
+    return 0
+
+
+def find_permutation_occurrences(pattern, text):
+    """Finds every window (substring) of text that is a permutation of
+    pattern.
+
+    Slides a window of len(pattern) chars along text, keeping a rolling
+    histogram of differences between value counts of pattern and of window,
+    as well as a count of chars whose counts don't match. Each step only
+    updates the chars entering and leaving window, so O(len(text)) time,
+    rather than O(len(text) * len(pattern)) for calling is_permutation on
+    every window.
+
+    Parameters
+    ----------
+    pattern : str
+        String to find permutations of
+    text : str
+        String to search through
+
+    Returns
+    -------
+    occurrences : list of int
+        Start index of each window of text that is a permutation of pattern,
+        in increasing order
+    """
+    window_size = len(pattern)
+
+    # Keys are chars; values are count in pattern minus count in window
+    count_diffs = value_counts(pattern)
+    # Keep track of how many chars have counts that don't match
+    num_unmatched = len(count_diffs)
+
+    # Handle special case of empty pattern, which matches any empty window
+    if window_size == 0:
+        return list(range(len(text) + 1))
+
+    occurrences = []
+    for i, char in enumerate(text):
+        # Add char entering window
+        num_unmatched += _update_count_diff(count_diffs, char, -1)
+
+        # Remove char leaving window, once window is full
+        if i >= window_size:
+            num_unmatched += _update_count_diff(
+                count_diffs, text[i - window_size], 1
+            )
+
+        # Window is a permutation of pattern if all counts match
+        if num_unmatched == 0:
+            occurrences.append(i - window_size + 1)
+
+    return occurrences
+
+
+# No. of chars (or bytes) to read from a stream at a time
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def is_permutation_stream(stream_1, stream_2, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Checks to see if contents of stream_1 is a permutation of contents of
+    stream_2.
+
+    Streams are read chunk by chunk, keeping a running histogram of the value
+    counts of each stream, in a Counter (which counts a whole chunk in C).
+    Peak memory is therefore O(alphabet size + chunk_size), however large the
+    streams are.
+
+    Parameters
+    ----------
+    stream_1 : file-like
+        First stream in comparison. Any object with a read(size) method, e.g.
+        a file object, io.BytesIO or mmap.mmap.
+    stream_2 : file-like
+        Second stream in comparison
+    chunk_size : int
+        Max no. of chars (or bytes) to read from each stream at a time
+
+    Returns
+    -------
+    bool
+        True if contents of stream_1 is permutation of contents of stream_2,
+        False otherwise
+    """
+    # Keys are each unique char (or byte) found in stream; values are count
+    counts_1 = collections.Counter()
+    counts_2 = collections.Counter()
+
+    # Keep reading until both streams are exhausted
+    chunk_1 = stream_1.read(chunk_size)
+    chunk_2 = stream_2.read(chunk_size)
+    while chunk_1 or chunk_2:
+        counts_1.update(chunk_1)
+        counts_2.update(chunk_2)
+
+        chunk_1 = stream_1.read(chunk_size)
+        chunk_2 = stream_2.read(chunk_size)
+
+    # Streams are permutations of each other if, and only if, all counts match
+    return counts_1 == counts_2
+
+
+def is_permutation_files(file_path_1, file_path_2,
+                         chunk_size=DEFAULT_CHUNK_SIZE):
+    """Checks to see if contents of one file is a permutation of contents of
+    another file, byte by byte.
+
+    Files are memory-mapped, rather than read into memory, then compared using
+    is_permutation_stream.
+
+    Parameters
+    ----------
+    file_path_1 : str
+        Path to first file in comparison
+    file_path_2 : str
+        Path to second file in comparison
+    chunk_size : int
+        Max no. of bytes to compare at a time
+
+    Returns
+    -------
+    bool
+        True if contents of first file is permutation of contents of second
+        file, False otherwise
+    """
+    # First check that file sizes match
+    file_size = os.path.getsize(file_path_1)
+    if file_size != os.path.getsize(file_path_2):
+        return False
+
+    # Handle special case of empty files, which can't be memory-mapped
+    if file_size == 0:
+        return True
+
+    with open(file_path_1, 'rb') as file_1, open(file_path_2, 'rb') as file_2:
+        map_1 = mmap.mmap(file_1.fileno(), 0, access=mmap.ACCESS_READ)
+        map_2 = mmap.mmap(file_2.fileno(), 0, access=mmap.ACCESS_READ)
+        with map_1, map_2:
+            return is_permutation_stream(map_1, map_2, chunk_size)
+
+
+def histogram_signature(input_string):
+    """Computes a canonical signature of the value counts of input_string.
+
+    Two strings have the same signature if, and only if, one is a permutation
+    of the other. Unlike sorting input_string, this is O(n) time.
+
+    Parameters
+    ----------
+    input_string : str
+        String to process
+
+    Returns
+    -------
+    frozenset
+        Hashable set of (char, count) pairs, for each unique char in
+        input_string
+    """
+    return frozenset(value_counts(input_string).items())
+
+
+class AnagramIndex():
+    """Class to group strings into permutation (anagram) classes
+
+    Uses a hash table, keyed by histogram_signature, so finding all
+    permutations of a string is O(n) time (n is the length of the string),
+    rather than calling is_permutation on every string in the index.
+    """
+
+    def __init__(self, input_strings=()):
+        """Set up hash table, and add input_strings to index
+
+        Parameters
+        ----------
+        input_strings : iterable of str
+            Strings to add to index
+        """
+        # Keys are signatures; values are lists of strings with that signature
+        self.permutation_classes = {}
+        self.add_all(input_strings)
+
+    def add(self, input_string):
+        """Add input_string to index
+
+        Parameters
+        ----------
+        input_string : str
+            String to add to index
+        """
+        signature = histogram_signature(input_string)
+        if signature in self.permutation_classes:
+            self.permutation_classes[signature].append(input_string)
+        else:
+            self.permutation_classes[signature] = [input_string]
+
+    def add_all(self, input_strings):
+        """Add each string in input_strings to index
+
+        Parameters
+        ----------
+        input_strings : iterable of str
+            Strings to add to index
+        """
+        for input_string in input_strings:
+            self.add(input_string)
+
+    def add_file(self, file_path):
+        """Add each word in a file to index, with one word per line
+
+        File is streamed line by line, so is never held in memory all at once.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to word file
+        """
+        with open(file_path) as word_file:
+            self.add_all(line.rstrip('\n') for line in word_file)
+
+    def find_permutations(self, input_string):
+        """Find all strings in index that are a permutation of input_string
+
+        Parameters
+        ----------
+        input_string : str
+            String to find permutations of
+
+        Returns
+        -------
+        list of str
+            Strings in index that are permutations of input_string, in the
+            order they were added
+        """
+        return list(
+            self.permutation_classes.get(histogram_signature(input_string), [])
+        )
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -74,6 +344,85 @@ class Test(unittest.TestCase):
                 is_permutation(test_input[0], test_input[1]), test_output
             )
 
+    def test_is_permutation_stream(self):
+        for test_input, test_output in self.data:
+            # Use small chunk size, to check comparison across chunks
+            self.assertEqual(
+                is_permutation_stream(
+                    io.StringIO(test_input[0]), io.StringIO(test_input[1]),
+                    chunk_size=2
+                ), test_output
+            )
+            self.assertEqual(
+                is_permutation_stream(
+                    io.BytesIO(test_input[0].encode()),
+                    io.BytesIO(test_input[1].encode()),
+                    chunk_size=2
+                ), test_output
+            )
+
+    def test_is_permutation_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_paths = []
+            file_contents = [b'silent', b'listen', b'python', b'']
+            for i, contents in enumerate(file_contents):
+                file_path = os.path.join(temp_dir, '{}.txt'.format(i))
+                with open(file_path, 'wb') as f:
+                    f.write(contents)
+                file_paths.append(file_path)
+
+            # Test permutation, non-permutation, and empty files
+            self.assertTrue(is_permutation_files(*file_paths[0:2], 4))
+            self.assertFalse(is_permutation_files(*file_paths[1:3], 4))
+            self.assertFalse(is_permutation_files(*file_paths[2:4], 4))
+            self.assertTrue(is_permutation_files(file_paths[3], file_paths[3]))
+
+    def test_find_permutation_occurrences(self):
+        self.assertEqual(
+            find_permutation_occurrences('abc', 'cbabcacab'), [0, 2, 3, 6]
+        )
+        self.assertEqual(
+            find_permutation_occurrences('aab', 'abaabaa'), [0, 1, 2, 3, 4]
+        )
+        self.assertEqual(find_permutation_occurrences('silent', 'list'), [])
+        self.assertEqual(find_permutation_occurrences('xyz', 'abcabc'), [])
+        self.assertEqual(find_permutation_occurrences('', 'ab'), [0, 1, 2])
+
+        # Compare against calling is_permutation on every window
+        pattern, text = 'tset', 'this is a test of set test streams'
+        self.assertEqual(
+            find_permutation_occurrences(pattern, text),
+            [
+                i for i in range(len(text) - len(pattern) + 1)
+                if is_permutation(pattern, text[i: i + len(pattern)])
+            ]
+        )
+
+    def test_AnagramIndex(self):
+        words = ['silent', 'python', 'listen', 'enlist', 'thonpy', 'Listen']
+
+        # Test index built from iterable
+        index = AnagramIndex(words)
+        self.assertEqual(
+            index.find_permutations('tinsel'), ['silent', 'listen', 'enlist']
+        )
+        self.assertEqual(
+            index.find_permutations('python'), ['python', 'thonpy']
+        )
+        self.assertEqual(index.find_permutations('pythonn'), [])
+
+        # Test index built from streamed word file
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'words.txt')
+            with open(file_path, 'w') as word_file:
+                word_file.write('\n'.join(words) + '\n')
+
+            index = AnagramIndex()
+            index.add_file(file_path)
+
+        self.assertEqual(index.find_permutations('Tinsel'), [])
+        self.assertEqual(index.find_permutations('Lentis'), ['Listen'])
+
 
 if __name__ == '__main__':
 
@@ -1,3 +1,7 @@
+import asyncio
+import io
+import sys
+import time
 import unittest
 
 
@@ -83,6 +87,401 @@ def URLify_solution(input_string):
     return ''.join(chars)
 
 
+# Max no. of bytes of original string to encode at a time, in URLify_in_place
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def URLify_in_place(buffer, true_length, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Same goal as URLify_solution, but works on the bytes of the string
+    in-place, in a buffer with enough spare capacity at the end to hold the
+    result, as in the book.
+
+    Works backwards through original string, like URLify_solution, but a
+    chunk of chars at a time, rather than a char at a time. Each chunk is
+    encoded into a temporary bytes object, then written directly into its
+    final place in buffer, so extra memory is O(chunk_size), rather than O(n)
+    for a char array.
+
+    Parameters
+    ----------
+    buffer : bytearray or memoryview
+        Writable buffer, holding string to process in its first true_length
+        bytes
+    true_length : int
+        Length of string in buffer; rest of buffer is spare capacity
+    chunk_size : int
+        Max no. of bytes of original string to encode at a time
+
+    Returns
+    -------
+    int
+        Length of string in buffer, with spaces replaced by '%20'
+    """
+    view = memoryview(buffer)
+
+    # First, count number of spaces in string
+    space_count = 0
+    for chunk_start in range(0, true_length, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, true_length)
+        space_count += bytes(view[chunk_start: chunk_end]).count(b' ')
+
+    # Check that there are spaces
+    if space_count == 0:
+        return true_length
+
+    # Check that buffer has enough capacity for the result
+    new_length = true_length + space_count * 2
+    if new_length > len(view):
+        raise Exception(
+            'Buffer too small: need {} bytes, got {}'.format(
+                new_length, len(view)
+            )
+        )
+
+    # Highest unused index (exclusive) at back of buffer
+    write_index = new_length
+    # Iterate through chunks of original string, backwards. Write index never
+    # falls behind end of chunk being read, so no unread chars are overwritten
+    chunk_end = true_length
+    while chunk_end > 0:
+        chunk_start = max(chunk_end - chunk_size, 0)
+        # Replace spaces in chunk, using split and join, which loop over the
+        # bytes in C rather than Python
+        encoded_chunk = b'%20'.join(
+            bytes(view[chunk_start: chunk_end]).split(b' ')
+        )
+
+        # Insert encoded chunk at back of buffer
+        view[write_index - len(encoded_chunk): write_index] = encoded_chunk
+        write_index -= len(encoded_chunk)
+
+        chunk_end = chunk_start
+
+    return new_length
+
+
+class URLifyEncoder():
+    """Class to URLify a stream incrementally, chunk by chunk
+
+    Each chunk is encoded with a single replace() (one pass in C), so no more
+    than one chunk (and its encoding) is held in memory at once, however long
+    the stream is. Since a space is only ever a single char (and single byte
+    in UTF-8), no state needs to be carried between chunks.
+    """
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Input values
+
+        Parameters
+        ----------
+        chunk_size : int
+            Max no. of chars (or bytes) to read from a stream at a time
+        """
+        self.chunk_size = chunk_size
+
+    def encode(self, chunk):
+        """URLify a single chunk
+
+        Parameters
+        ----------
+        chunk : bytes or str
+            Chunk to encode
+
+        Returns
+        -------
+        bytes or str
+            chunk, with spaces replaced by '%20'. Same type as chunk.
+        """
+        if isinstance(chunk, str):
+            return chunk.replace(' ', '%20')
+
+        return bytes(chunk).replace(b' ', b'%20')
+
+    def iter_encode(self, stream):
+        """URLify a stream, yielding encoded chunks as they are read
+
+        Parameters
+        ----------
+        stream : file-like
+            Any object with a read(size) method, e.g. a file object
+
+        Yields
+        ------
+        bytes or str
+            Encoded chunk of stream
+        """
+        chunk = stream.read(self.chunk_size)
+        while chunk:
+            yield self.encode(chunk)
+            chunk = stream.read(self.chunk_size)
+
+    async def aiter_encode(self, reader):
+        """URLify an asyncio stream, yielding encoded chunks as they are read
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            Stream to read from
+
+        Yields
+        ------
+        bytes
+            Encoded chunk of stream
+        """
+        chunk = await reader.read(self.chunk_size)
+        while chunk:
+            yield self.encode(chunk)
+            chunk = await reader.read(self.chunk_size)
+
+
+# Chars that never need percent-encoding, as defined in RFC 3986
+UNRESERVED_CHARS = (
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~'
+)
+HEX_DIGITS = b'0123456789ABCDEFabcdef'
+
+# Keys are every valid 2 hex digit sequence (any case); values are the byte
+# that sequence represents
+HEX_PAIRS = {
+    bytes((digit_1, digit_2)): bytes((int(bytes((digit_1, digit_2)), 16),))
+    for digit_1 in HEX_DIGITS for digit_2 in HEX_DIGITS
+}
+
+# Max no. of reserved bytes for which bytes.replace is used to encode, rather
+# than encoding table
+MAX_REPLACE_RESERVED = 4
+
+
+class PercentCodec():
+    """Class to percent-encode (generalised URLify), and decode, strings with
+    any set of reserved bytes
+
+    Encoding looks each byte up in a precomputed 256 entry table, rather than
+    branching on every char. Where possible, faster paths are used: input with
+    nothing to encode is returned as is (checked with bytes.translate), and
+    small reserved sets are encoded with a bytes.replace per reserved byte,
+    which loops in C.
+    """
+
+    def __init__(self, reserved=None):
+        """Build encoding table
+
+        Parameters
+        ----------
+        reserved : bytes
+            Bytes to percent-encode. '%' is always encoded too, so decoding
+            gives back the original input. Defaults to every byte that isn't
+            in UNRESERVED_CHARS.
+        """
+        if reserved is None:
+            reserved = bytes(
+                byte for byte in range(256) if byte not in UNRESERVED_CHARS
+            )
+        # '%' goes first, so it is replaced before any other byte, rather than
+        # replacing the '%'s inserted by other bytes
+        self.reserved = b'%' + bytes(sorted(set(reserved) - {ord('%')}))
+
+        # Entry i is encoding of byte i
+        self.encoding_table = [bytes((byte,)) for byte in range(256)]
+        for byte in self.reserved:
+            self.encoding_table[byte] = b'%%%02X' % byte
+
+        # Replacing can only be used if the hex digits it inserts won't be
+        # replaced again by a later replace
+        self.use_replace = (
+            len(self.reserved) <= MAX_REPLACE_RESERVED and
+            not any(byte in HEX_DIGITS for byte in self.reserved)
+        )
+
+    def encode(self, data):
+        """Percent-encode reserved bytes in data
+
+        Parameters
+        ----------
+        data : bytes or str
+            Data to encode. str is encoded as UTF-8 first.
+
+        Returns
+        -------
+        bytes or str
+            Encoded data. Same type as data.
+        """
+        # Handle text by encoding it
+        if isinstance(data, str):
+            return self.encode(data.encode()).decode()
+
+        # Check for special case of no reserved bytes in data
+        if len(data.translate(None, self.reserved)) == len(data):
+            return bytes(data)
+
+        if self.use_replace:
+            for byte in self.reserved:
+                data = data.replace(bytes((byte,)), self.encoding_table[byte])
+            return data
+
+        return b''.join(map(self.encoding_table.__getitem__, data))
+
+    def decode(self, data):
+        """Decode percent-encoded data, in a single pass
+
+        Parameters
+        ----------
+        data : bytes or str
+            Data to decode. If str, decoded bytes are decoded as UTF-8.
+
+        Returns
+        -------
+        bytes or str
+            Decoded data. Same type as data.
+        """
+        # Handle text by encoding it
+        if isinstance(data, str):
+            return self.decode(data.encode()).decode()
+
+        # Every part after the first must start with 2 hex digits, which
+        # followed a '%'
+        parts = data.split(b'%')
+        decoded_parts = [parts[0]]
+        for part in parts[1:]:
+            decoded_byte = HEX_PAIRS.get(part[:2])
+            if decoded_byte is None:
+                raise Exception(
+                    'Invalid percent-encoded sequence: %{}'.format(
+                        part[:2].decode('latin-1')
+                    )
+                )
+            decoded_parts.append(decoded_byte)
+            decoded_parts.append(part[2:])
+
+        return b''.join(decoded_parts)
+
+
+def _benchmark_helper(functions, payload):
+    """Print throughput of each function, on payload
+
+    Parameters
+    ----------
+    functions : dict
+        Keys are names to print; values are functions to time, which take
+        payload as their only argument
+    payload : bytes or str
+        Input to each function
+    """
+    megabytes = len(payload) / 2**20
+    for name, function in functions.items():
+        start = time.perf_counter()
+        function(payload)
+        function_time = time.perf_counter() - start
+        print('    {:<28} {:.1f} MB/s'.format(
+            name + ':', megabytes / function_time
+        ))
+
+
+def benchmark_PercentCodec(size=2**20):
+    """Print throughput of PercentCodec, compared with URLify_solution, which
+    loops over each char. URLify isn't included, since it is O(n^2) time.
+
+    Parameters
+    ----------
+    size : int
+        Size of payload, in bytes
+    """
+    words = 'the quick brown fox jumps over the lazy dog '
+    payload = (words * (size // len(words) + 1))[:size]
+    space_codec = PercentCodec(b' ')
+    full_codec = PercentCodec()
+
+    print('encoding spaces, {:,} byte payload'.format(size))
+    _benchmark_helper({
+        'URLify_solution': URLify_solution,
+        'PercentCodec(b\' \').encode': space_codec.encode,
+    }, payload)
+
+    print('encoding all reserved chars, {:,} byte payload'.format(size))
+    _benchmark_helper({'PercentCodec().encode': full_codec.encode}, payload)
+
+    encoded_payload = full_codec.encode(payload)
+    print('decoding, {:,} byte payload'.format(len(encoded_payload)))
+    _benchmark_helper(
+        {'PercentCodec().decode': full_codec.decode}, encoded_payload
+    )
+
+
+def benchmark_URLify_in_place(size=100 * 2**20):
+    """Print time taken by URLify_in_place on a large payload, compared with
+    URLify_solution.
+
+    Parameters
+    ----------
+    size : int
+        Size of payload, in bytes
+    """
+    # Payload where about 1 in 8 chars is a space
+    words = b'the quick brown fox jumps over the lazy dog '
+    payload = (words * (size // len(words) + 1))[:size]
+    buffer = bytearray(payload) + bytearray(payload.count(b' ') * 2)
+
+    start = time.perf_counter()
+    URLify_in_place(buffer, size)
+    in_place_time = time.perf_counter() - start
+
+    input_string = payload.decode('ascii')
+    start = time.perf_counter()
+    URLify_solution(input_string)
+    solution_time = time.perf_counter() - start
+
+    print('{:,} byte payload'.format(size))
+    print('    URLify_solution: {:.2f}s'.format(solution_time))
+    print('    URLify_in_place: {:.2f}s'.format(in_place_time))
+
+
+def benchmark_URLifyEncoder(size=100 * 2**20):
+    """Print throughput of URLifyEncoder on a large stream, compared with
+    reading whole stream into memory, then using URLify_in_place.
+
+    Parameters
+    ----------
+    size : int
+        Size of stream, in bytes
+    """
+    words = b'the quick brown fox jumps over the lazy dog '
+    payload = (words * (size // len(words) + 1))[:size]
+
+    start = time.perf_counter()
+    buffer = bytearray(io.BytesIO(payload).read())
+    buffer.extend(bytearray(buffer.count(b' ') * 2))
+    URLify_in_place(buffer, size)
+    materialized_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in URLifyEncoder().iter_encode(io.BytesIO(payload)):
+        pass
+    stream_time = time.perf_counter() - start
+
+    async def encode_async_stream():
+        reader = asyncio.StreamReader()
+        reader.feed_data(payload)
+        reader.feed_eof()
+        async for _ in URLifyEncoder().aiter_encode(reader):
+            pass
+
+    start = time.perf_counter()
+    asyncio.run(encode_async_stream())
+    async_stream_time = time.perf_counter() - start
+
+    megabytes = size / 2**20
+    print('{:,} byte stream'.format(size))
+    print('    materialized:                {:.0f} MB/s'.format(
+        megabytes / materialized_time
+    ))
+    print('    URLifyEncoder.iter_encode:   {:.0f} MB/s'.format(
+        megabytes / stream_time
+    ))
+    print('    URLifyEncoder.aiter_encode:  {:.0f} MB/s'.format(
+        megabytes / async_stream_time
+    ))
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -100,7 +499,87 @@ class Test(unittest.TestCase):
         for test_input, test_output in self.data:
             self.assertEqual(URLify(test_input), test_output)
 
+    def test_URLify_in_place(self):
+        for test_input, test_output in self.data:
+            # Test bytearray and memoryview buffers, with exactly enough, and
+            # more than enough, spare capacity
+            for spare_capacity in [0, 5]:
+                capacity = len(test_output) - len(test_input) + spare_capacity
+                buffer = bytearray(test_input.encode()) + bytearray(capacity)
+
+                for view in [buffer[:], memoryview(buffer[:])]:
+                    # Use small chunk size, to check spaces across chunks
+                    new_length = URLify_in_place(
+                        view, len(test_input), chunk_size=3
+                    )
+                    self.assertEqual(
+                        bytes(view[:new_length]), test_output.encode()
+                    )
+
+        # Test buffer without enough capacity
+        with self.assertRaises(Exception):
+            URLify_in_place(bytearray(b'a b'), 3)
+
+    def test_URLifyEncoder(self):
+        test_input = 'the quick brown fox  jumps'
+        test_output = 'the%20quick%20brown%20fox%20%20jumps'
+
+        # Use small chunk size, to check spaces across chunks
+        encoder = URLifyEncoder(chunk_size=4)
+        self.assertEqual(
+            ''.join(encoder.iter_encode(io.StringIO(test_input))), test_output
+        )
+        self.assertEqual(
+            b''.join(encoder.iter_encode(io.BytesIO(test_input.encode()))),
+            test_output.encode()
+        )
+
+        # Test chunk bigger than chunk_size
+        self.assertEqual(encoder.encode(test_input), test_output)
+
+        async def encode_async_stream():
+            reader = asyncio.StreamReader()
+            reader.feed_data(test_input.encode())
+            reader.feed_eof()
+            return [chunk async for chunk in encoder.aiter_encode(reader)]
+
+        self.assertEqual(
+            b''.join(asyncio.run(encode_async_stream())), test_output.encode()
+        )
+
+    def test_PercentCodec(self):
+        # Test encoding just spaces, which should match URLify
+        space_codec = PercentCodec(b' ')
+        for test_input, test_output in self.data:
+            self.assertEqual(space_codec.encode(test_input), test_output)
+            self.assertEqual(space_codec.decode(test_output), test_input)
+
+        # Test encoding every reserved char, with and without replace
+        for codec in [PercentCodec(), PercentCodec(b' /?#&')]:
+            self.assertEqual(
+                codec.encode('a b/c?d%e'), 'a%20b%2Fc%3Fd%25e'
+            )
+            self.assertEqual(
+                codec.decode('a%20b%2fc%3Fd%25e'), 'a b/c?d%e'
+            )
+
+        # Test round trip of every byte
+        codec = PercentCodec()
+        self.assertEqual(codec.decode(codec.encode(bytes(range(256)))),
+                         bytes(range(256)))
+        self.assertEqual(codec.encode(b'safe-string'), b'safe-string')
+
+        # Test invalid percent-encoded sequences
+        for invalid_input in [b'%', b'ab%4', b'%zz', b'%2g']:
+            with self.assertRaises(Exception):
+                codec.decode(invalid_input)
+
 
 if __name__ == '__main__':
 
-    unittest.main()
+    if '--benchmark' in sys.argv:
+        benchmark_URLify_in_place()
+        benchmark_URLifyEncoder()
+        benchmark_PercentCodec()
+    else:
+        unittest.main()
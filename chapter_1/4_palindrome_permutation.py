@@ -1,3 +1,12 @@
+import codecs
+import collections
+import concurrent.futures
+import mmap
+import os
+import random
+import sys
+import tempfile
+import time
 import unittest
 
 
@@ -127,6 +136,553 @@ def is_exactly_one_bit_set(bit_vector):
     return (bit_vector & (bit_vector - 1)) == 0
 
 
+class CompressedParityTracker():
+    """Class to track which chars occur an odd no. of times in a string, using
+    a bit vector with one bit per unique char found, rather than one bit per
+    unicode code point.
+
+    With create_bit_vector, a char with a large code point (e.g. an emoji)
+    makes the bit vector int very large, and every toggle copies it. Here,
+    each unique char is mapped to the next unused (dense) index the first time
+    it is found, so the bit vector only has as many bits as there are unique
+    chars.
+    """
+
+    def __init__(self):
+        """Initialise empty bit vector, and char to index mapping
+        """
+        # Keys are each unique char found; values are index of char's bit in
+        # bit_vector
+        self.char_indices = {}
+        self.bit_vector = 0
+
+    def update(self, input_string):
+        """Toggle bits of each char in input_string
+
+        Parameters
+        ----------
+        input_string : str
+            String to process
+        """
+        # Use local variables in loop, for speed
+        char_indices = self.char_indices
+        bit_vector = self.bit_vector
+        for char in input_string:
+            index = char_indices.get(char)
+            # Assign next unused index to chars not found before
+            if index is None:
+                index = len(char_indices)
+                char_indices[char] = index
+            # Same as toggle(bit_vector, index)
+            bit_vector ^= 1 << index
+
+        self.bit_vector = bit_vector
+
+    def is_palindrome_permutation(self):
+        """Checks to see if chars processed so far are a permutation of a
+        palindrome
+
+        Returns
+        -------
+        bool
+            True if chars are a palindrome permutation, False otherwise
+        """
+        # bit_vector must be all 0s, or just have 1 bit set (to 1)
+        return self.bit_vector == 0 or is_exactly_one_bit_set(self.bit_vector)
+
+
+def is_palindrome_permutation_compressed(input_string):
+    """Same goal as is_palindrome_permutation_solution, but using
+    CompressedParityTracker, so memory doesn't depend on size of code points
+    in input_string.
+    """
+    tracker = CompressedParityTracker()
+    tracker.update(input_string)
+    return tracker.is_palindrome_permutation()
+
+
+class PalindromePermutationTracker():
+    """Class to track whether a string is a palindrome permutation, as chars
+    are added to, and removed from, it
+
+    Keeps count of each char, and of how many chars have odd counts, so each
+    update and check is O(1) time, rather than O(n) time for calling
+    is_palindrome_permutation on whole string after every update.
+    """
+
+    def __init__(self, input_string=''):
+        """Initialise counts, then append each char in input_string
+
+        Parameters
+        ----------
+        input_string : str
+            Initial string
+        """
+        # Keys are each char in string; values are count of char
+        self.char_counts = {}
+        # Keep track of how many chars have odd counts
+        self.num_odd_counts = 0
+
+        for char in input_string:
+            self.append(char)
+
+    def _update_count(self, char, change):
+        """Add change to count of char, updating num_odd_counts
+
+        Parameters
+        ----------
+        char : str
+            Char to update count of
+        change : int
+            Amount to add to count; either 1 or -1
+        """
+        count = self.char_counts.get(char, 0) + change
+
+        # Remove chars with zero count, so memory doesn't grow with every
+        # char ever added
+        if count == 0:
+            del self.char_counts[char]
+        else:
+            self.char_counts[char] = count
+
+        # Adding or removing a char always flips whether its count is odd
+        if count % 2 == 1:
+            self.num_odd_counts += 1
+        else:
+            self.num_odd_counts -= 1
+
+    def append(self, char):
+        """Add char to string
+
+        Parameters
+        ----------
+        char : str
+            Char to add
+        """
+        self._update_count(char, 1)
+
+    def remove(self, char):
+        """Remove one occurrence of char from string
+
+        Parameters
+        ----------
+        char : str
+            Char to remove
+        """
+        if char not in self.char_counts:
+            raise Exception('{} is not in string.'.format(char))
+
+        self._update_count(char, -1)
+
+    def is_palindrome_permutation(self):
+        """Checks to see if string is a permutation of a palindrome
+
+        Returns
+        -------
+        bool
+            True if string is a palindrome permutation, False otherwise
+        """
+        # Allow up to 1 odd count
+        return self.num_odd_counts <= 1
+
+
+class PalindromePermutationIndex():
+    """Class to answer queries about which substrings of a string are
+    palindrome permutations
+
+    Stores prefix parity masks: mask i is the bit vector (as in
+    CompressedParityTracker) of the first i chars of the string. Since
+    toggling is XOR, the bit vector of substring [i, j) is mask i XOR mask j,
+    so any substring can be checked in O(1) time, rather than O(n) time for
+    calling is_palindrome_permutation on it.
+    """
+
+    def __init__(self, input_string):
+        """Compute prefix parity masks of input_string
+
+        Parameters
+        ----------
+        input_string : str
+            String to index
+        """
+        # Keys are each unique char in input_string; values are index of
+        # char's bit in masks
+        self.char_indices = {}
+        self.prefix_masks = [0]
+
+        bit_vector = 0
+        for char in input_string:
+            index = self.char_indices.get(char)
+            if index is None:
+                index = len(self.char_indices)
+                self.char_indices[char] = index
+            bit_vector ^= 1 << index
+            self.prefix_masks.append(bit_vector)
+
+    def is_palindrome_permutation(self, start_index, end_index):
+        """Checks to see if substring [start_index, end_index) is a
+        palindrome permutation
+
+        Parameters
+        ----------
+        start_index : int
+            Index of first char in substring
+        end_index : int
+            Index after last char in substring
+
+        Returns
+        -------
+        bool
+            True if substring is a palindrome permutation, False otherwise
+        """
+        bit_vector = (
+            self.prefix_masks[start_index] ^ self.prefix_masks[end_index]
+        )
+        return bit_vector == 0 or is_exactly_one_bit_set(bit_vector)
+
+    def _matching_masks(self, mask):
+        """Find all masks that, XORed with mask, give a bit vector with at
+        most 1 bit set
+
+        Parameters
+        ----------
+        mask : int
+            Prefix parity mask
+
+        Returns
+        -------
+        list of int
+            mask itself, and mask with each bit toggled in turn
+        """
+        return [mask] + [
+            mask ^ (1 << index) for index in range(len(self.char_indices))
+        ]
+
+    def count_palindrome_permutations(self):
+        """Count non-empty substrings that are palindrome permutations
+
+        O(n * k) time, where k is the no. of unique chars, using a hash table
+        of counts of prefix masks found so far.
+
+        Returns
+        -------
+        count : int
+            No. of palindrome permutation substrings
+        """
+        # Keys are prefix masks found so far; values are counts of mask
+        mask_counts = {}
+        count = 0
+        for mask in self.prefix_masks:
+            # Each earlier prefix with a matching mask is the start of a
+            # palindrome permutation that ends here
+            for matching_mask in self._matching_masks(mask):
+                count += mask_counts.get(matching_mask, 0)
+
+            if mask in mask_counts:
+                mask_counts[mask] += 1
+            else:
+                mask_counts[mask] = 1
+
+        return count
+
+    def find_palindrome_permutations(self):
+        """Find all non-empty substrings that are palindrome permutations
+
+        Yields
+        ------
+        tuple of int
+            (start_index, end_index) of each palindrome permutation
+            substring, ordered by end_index, then start_index
+        """
+        # Keys are prefix masks found so far; values are lists of indices of
+        # prefixes with that mask
+        mask_indices = {}
+        for end_index, mask in enumerate(self.prefix_masks):
+            start_indices = []
+            for matching_mask in self._matching_masks(mask):
+                start_indices.extend(mask_indices.get(matching_mask, []))
+            for start_index in sorted(start_indices):
+                yield start_index, end_index
+
+            if mask in mask_indices:
+                mask_indices[mask].append(end_index)
+            else:
+                mask_indices[mask] = [end_index]
+
+
+def _odd_chars(char_counts):
+    """Find chars that have an odd count
+
+    This is a dense parity map of a chunk of a string: it only holds chars
+    found in the chunk, however large their code points are.
+
+    Parameters
+    ----------
+    char_counts : collections.Counter
+        Counts of each char in a chunk
+
+    Returns
+    -------
+    set of str
+        Chars with odd counts
+    """
+    return {char for char, count in char_counts.items() if count % 2 == 1}
+
+
+def _chunk_odd_chars(chunk):
+    """Find chars that occur an odd no. of times in chunk
+
+    Parameters
+    ----------
+    chunk : str
+        Chunk of string to process
+
+    Returns
+    -------
+    set of str
+        Chars with odd counts in chunk
+    """
+    return _odd_chars(collections.Counter(chunk))
+
+
+def _xor_odd_chars(odd_char_sets):
+    """Combine sets of chars with odd counts in consecutive chunks of a
+    string into set of chars with odd counts in whole string
+
+    A char's count in the whole string is odd if, and only if, it is odd in
+    an odd no. of chunks, so the sets are combined with symmetric difference
+    (XOR), like bit vectors.
+
+    Parameters
+    ----------
+    odd_char_sets : iterable of set of str
+        Sets of chars with odd counts in each chunk
+
+    Returns
+    -------
+    odd_chars : set of str
+        Chars with odd counts in whole string
+    """
+    odd_chars = set()
+    for chunk_odd_chars in odd_char_sets:
+        odd_chars ^= chunk_odd_chars
+
+    return odd_chars
+
+
+def is_palindrome_permutation_parallel(input_string, num_workers=None):
+    """Same goal as is_palindrome_permutation_solution, but splits
+    input_string into a chunk per worker, and finds chars with odd counts in
+    each chunk in a separate process, in parallel.
+
+    Parameters
+    ----------
+    input_string : str
+        String to check
+    num_workers : int
+        No. of processes to use. Defaults to no. of CPUs.
+
+    Returns
+    -------
+    bool
+        True if input_string is a palindrome permutation, False otherwise
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count()
+
+    chunk_size = -(-len(input_string) // num_workers)  # round up
+    chunks = [
+        input_string[i: i + chunk_size]
+        for i in range(0, len(input_string), chunk_size or 1)
+    ]
+
+    with concurrent.futures.ProcessPoolExecutor(num_workers) as executor:
+        odd_chars = _xor_odd_chars(executor.map(_chunk_odd_chars, chunks))
+
+    return len(odd_chars) <= 1
+
+
+# Max no. of bytes of a file chunk that a worker decodes at a time
+FILE_SUB_CHUNK_SIZE = 1 << 20
+
+
+def _file_chunk_odd_chars(file_path, start_index, end_index,
+                          sub_chunk_size=FILE_SUB_CHUNK_SIZE):
+    """Find chars that occur an odd no. of times in a chunk of a UTF-8 file,
+    using a memory map
+
+    The chunk is decoded sub_chunk_size bytes at a time, with an incremental
+    decoder (which carries any multi-byte char split between sub-chunks over
+    to the next one), so only one sub-chunk is held in memory at a time,
+    however large the chunk is.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to file
+    start_index : int
+        Index of first byte in chunk
+    end_index : int
+        Index after last byte in chunk
+    sub_chunk_size : int
+        Max no. of bytes to decode at a time
+
+    Returns
+    -------
+    set of str
+        Chars with odd counts in chunk
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    char_counts = collections.Counter()
+
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Slicing a memoryview doesn't copy the bytes
+            with memoryview(mapped) as view:
+                for i in range(start_index, end_index, sub_chunk_size):
+                    sub_chunk_end = min(i + sub_chunk_size, end_index)
+                    char_counts.update(decoder.decode(view[i: sub_chunk_end]))
+            char_counts.update(decoder.decode(b'', final=True))
+
+    return _odd_chars(char_counts)
+
+
+def _find_chunk_boundaries(file_path, num_chunks):
+    """Split a UTF-8 file into roughly equal chunks, without splitting any
+    multi-byte chars between chunks
+
+    Parameters
+    ----------
+    file_path : str
+        Path to file
+    num_chunks : int
+        Max no. of chunks to split file into
+
+    Returns
+    -------
+    boundaries : list of int
+        Byte indices of chunk boundaries, starting with 0, and ending with
+        file size
+    """
+    file_size = os.path.getsize(file_path)
+    boundaries = [0]
+
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for i in range(1, num_chunks):
+                boundary = max(file_size * i // num_chunks, boundaries[-1])
+                # Move boundary forward past any UTF-8 continuation bytes
+                # (10xxxxxx), so it is at the start of a char
+                while boundary < file_size and mapped[boundary] & 0xc0 == 0x80:
+                    boundary += 1
+                if boundary > boundaries[-1]:
+                    boundaries.append(boundary)
+
+    if file_size > boundaries[-1]:
+        boundaries.append(file_size)
+
+    return boundaries
+
+
+def is_palindrome_permutation_file(file_path, num_workers=None):
+    """Same goal as is_palindrome_permutation_parallel, but for the contents
+    of a UTF-8 file, which is memory-mapped by each worker, rather than read
+    into memory.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to file to check
+    num_workers : int
+        No. of processes to use. Defaults to no. of CPUs.
+
+    Returns
+    -------
+    bool
+        True if contents of file is a palindrome permutation, False otherwise
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count()
+
+    # Handle special case of empty file, which can't be memory-mapped
+    if os.path.getsize(file_path) == 0:
+        return True
+
+    boundaries = _find_chunk_boundaries(file_path, num_workers)
+
+    with concurrent.futures.ProcessPoolExecutor(num_workers) as executor:
+        odd_chars = _xor_odd_chars(executor.map(
+            _file_chunk_odd_chars, [file_path] * (len(boundaries) - 1),
+            boundaries[:-1], boundaries[1:]
+        ))
+
+    return len(odd_chars) <= 1
+
+
+def benchmark_is_palindrome_permutation_file(size=20 * 2**20):
+    """Print time taken by is_palindrome_permutation_file, for each no. of
+    workers from 1 to no. of CPUs, compared with
+    is_palindrome_permutation_solution.
+
+    Parameters
+    ----------
+    size : int
+        Size of file, in bytes
+    """
+    input_string = ''.join(random.choice('abcdefgh') for _ in range(size))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, 'input.txt')
+        with open(file_path, 'w') as f:
+            f.write(input_string)
+
+        print('{:,} byte file'.format(size))
+        start = time.perf_counter()
+        is_palindrome_permutation_solution(input_string)
+        print('    is_palindrome_permutation_solution: {:.2f}s'.format(
+            time.perf_counter() - start
+        ))
+
+        for num_workers in range(1, os.cpu_count() + 1):
+            start = time.perf_counter()
+            is_palindrome_permutation_file(file_path, num_workers)
+            print('    is_palindrome_permutation_file, {} workers: {:.2f}s'
+                  .format(num_workers, time.perf_counter() - start))
+
+
+def benchmark_is_palindrome_permutation_compressed(size=100000):
+    """Print time taken by is_palindrome_permutation_compressed on CJK and
+    emoji input, compared with is_palindrome_permutation and
+    is_palindrome_permutation_solution.
+
+    Parameters
+    ----------
+    size : int
+        Length of input strings
+    """
+    workloads = {
+        # 500 common CJK ideographs
+        'CJK': [chr(code) for code in range(0x4e00, 0x4e00 + 500)],
+        # Emoticons block
+        'emoji': [chr(code) for code in range(0x1f600, 0x1f650)],
+    }
+    functions = [
+        is_palindrome_permutation,
+        is_palindrome_permutation_solution,
+        is_palindrome_permutation_compressed,
+    ]
+
+    for name, alphabet in workloads.items():
+        input_string = ''.join(random.choice(alphabet) for _ in range(size))
+        print('{} ({:,} chars)'.format(name, size))
+        for function in functions:
+            start = time.perf_counter()
+            function(input_string)
+            print('    {:<38} {:.4f}s'.format(
+                function.__name__ + ':', time.perf_counter() - start
+            ))
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -135,7 +691,9 @@ class Test(unittest.TestCase):
         ('paalinnipl', True),
         ('paalinnipll',  True),
         ('paliinp',  False),
-        ('amanaplanacanalpanama', True)
+        ('amanaplanacanalpanama', True),
+        ('\U0001f600\u4e00\U0001f600', True),  # check CJK and emoji chars
+        ('\U0001f600\u4e00\U0001f601', False)
     ]
 
     def test_is_palindrome_permutation(self):
@@ -150,7 +708,100 @@ class Test(unittest.TestCase):
                 is_palindrome_permutation_solution(test_input), test_output
             )
 
+    def test_is_palindrome_permutation_compressed(self):
+        for test_input, test_output in self.data:
+            self.assertEqual(
+                is_palindrome_permutation_compressed(test_input), test_output
+            )
+
+    def test_PalindromePermutationTracker(self):
+        for test_input, test_output in self.data:
+            tracker = PalindromePermutationTracker(test_input)
+            self.assertEqual(tracker.is_palindrome_permutation(), test_output)
+
+        # Test checking after every append and remove
+        tracker = PalindromePermutationTracker()
+        input_string = 'tacocatx'
+        for i, char in enumerate(input_string):
+            tracker.append(char)
+            self.assertEqual(
+                tracker.is_palindrome_permutation(),
+                is_palindrome_permutation(input_string[:i + 1])
+            )
+        for i, char in enumerate(input_string):
+            tracker.remove(char)
+            self.assertEqual(
+                tracker.is_palindrome_permutation(),
+                is_palindrome_permutation(input_string[i + 1:])
+            )
+        self.assertEqual(tracker.char_counts, {})
+
+        # Test removing char not in string
+        with self.assertRaises(Exception):
+            tracker.remove('a')
+
+    def test_PalindromePermutationIndex(self):
+        input_string = 'amanaplanacanalpanama\U0001f600xx'
+        index = PalindromePermutationIndex(input_string)
+
+        # Compare against calling is_palindrome_permutation on every substring
+        expected = [
+            (i, j)
+            for j in range(len(input_string) + 1) for i in range(j)
+            if is_palindrome_permutation(input_string[i:j])
+        ]
+        self.assertEqual(list(index.find_palindrome_permutations()), expected)
+        self.assertEqual(index.count_palindrome_permutations(), len(expected))
+
+        # Test range queries
+        for i, j in [(0, 21), (0, 22), (1, 5), (21, 24), (22, 24)]:
+            self.assertEqual(
+                index.is_palindrome_permutation(i, j),
+                is_palindrome_permutation(input_string[i:j])
+            )
+
+        # Test empty string
+        self.assertEqual(
+            PalindromePermutationIndex('').count_palindrome_permutations(), 0
+        )
+
+    def test_is_palindrome_permutation_parallel(self):
+        for test_input, test_output in self.data:
+            self.assertEqual(
+                is_palindrome_permutation_parallel(test_input, 3), test_output
+            )
+        self.assertTrue(is_palindrome_permutation_parallel('', 2))
+
+    def test_is_palindrome_permutation_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'input.txt')
+            for test_input, test_output in self.data + [('', True)]:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(test_input)
+
+                # Use more workers than chars, to check multi-byte chars
+                # aren't split between chunks
+                self.assertEqual(
+                    is_palindrome_permutation_file(file_path, 8), test_output
+                )
+
+            # Test multi-byte chars split between sub-chunks are decoded
+            test_input = 'a\U0001f600\u4e00b\U0001f600'
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(test_input)
+            file_size = os.path.getsize(file_path)
+            for sub_chunk_size in [1, 3, file_size]:
+                self.assertEqual(
+                    _file_chunk_odd_chars(file_path, 0, file_size,
+                                          sub_chunk_size),
+                    {'a', '\u4e00', 'b'}
+                )
+
 
 if __name__ == '__main__':
 
-    unittest.main()
+    if '--benchmark' in sys.argv:
+        benchmark_is_palindrome_permutation_compressed()
+        benchmark_is_palindrome_permutation_file()
+    else:
+        unittest.main()
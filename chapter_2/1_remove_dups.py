@@ -1,7 +1,19 @@
+import bisect
+import heapq
+import math
+import pickle
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
 import unittest
 
 from data_structures.linked_lists.singly_linked_list import LinkedList
 
+from array_linked_list import NULL_INDEX, ArrayLinkedList
+
 
 def remove_dups(linked_list):
     """Remove duplicate values from a linked list
@@ -23,6 +35,9 @@ def remove_dups(linked_list):
     if linked_list.head is None:
         return linked_list
 
+    if isinstance(linked_list, ArrayLinkedList):
+        return _remove_dups_array(linked_list)
+
     # Initialise hash table to contain values found
     vals_found = {}
 
@@ -49,6 +64,29 @@ def remove_dups(linked_list):
     return linked_list
 
 
+def _remove_dups_array(linked_list):
+    """Same as remove_dups, for a non-empty ArrayLinkedList, walking node
+    indices, rather than creating an ArrayNode per node
+    """
+    values = linked_list.values
+    next_indices = linked_list.next_indices
+
+    vals_found = set()
+    prev_index = NULL_INDEX
+    index = linked_list.head_index
+    while index != NULL_INDEX:
+        next_index = next_indices[index]
+        if values[index] in vals_found:
+            # Unlink node. Head is never a duplicate, so prev_index is valid
+            next_indices[prev_index] = next_index
+        else:
+            vals_found.add(values[index])
+            prev_index = index
+        index = next_index
+
+    return linked_list
+
+
 def remove_dups_v2(linked_list):
     """Remove duplicate values from a linked list
 
@@ -96,6 +134,644 @@ def remove_dups_v2(linked_list):
     return linked_list
 
 
+def _split_after(node, num_nodes):
+    """Cut linked list after num_nodes nodes, starting at node
+
+    Parameters
+    ----------
+    node : Node in LinkedList
+        First node of sub-list to cut. Can be None.
+    num_nodes : int
+        No. of nodes to keep before the cut
+
+    Returns
+    -------
+    Node in LinkedList
+        First node after the cut, or None if there are no nodes left
+    """
+    for _ in range(num_nodes - 1):
+        if node is None:
+            return None
+        node = node.next_node
+
+    if node is None:
+        return None
+
+    rest = node.next_node
+    node.next_node = None
+    return rest
+
+
+def _merge_nodes(left, right, key):
+    """Merge two sorted chains of nodes into one, by relinking nodes
+
+    Merge is stable: for nodes with equal keys, nodes from left come first.
+
+    Parameters
+    ----------
+    left : Node in LinkedList
+        First node of first sorted chain. Can be None.
+    right : Node in LinkedList
+        First node of second sorted chain. Can be None.
+    key : function
+        Returns value to sort node by, given node
+
+    Returns
+    -------
+    tuple of Node
+        (head, tail): first and last node of merged chain
+    """
+    if left is None or right is None:
+        head = left if right is None else right
+        tail = head
+        while tail is not None and tail.next_node is not None:
+            tail = tail.next_node
+        return head, tail
+
+    # Pick head, taking from left if keys are equal, for stability
+    if key(right) < key(left):
+        head, right = right, right.next_node
+    else:
+        head, left = left, left.next_node
+    tail = head
+
+    while left is not None and right is not None:
+        if key(right) < key(left):
+            tail.next_node, right = right, right.next_node
+        else:
+            tail.next_node, left = left, left.next_node
+        tail = tail.next_node
+
+    # Attach whichever chain has nodes left over, and find new tail
+    tail.next_node = left if left is not None else right
+    while tail.next_node is not None:
+        tail = tail.next_node
+
+    return head, tail
+
+
+def _merge_sort_nodes(head, num_nodes, key):
+    """Stable, bottom-up merge sort of linked list, that only relinks nodes
+
+    O(n log n) time, with O(1) extra space, since no nodes are allocated, and
+    no recursion is used.
+
+    Parameters
+    ----------
+    head : Node in LinkedList
+        First node of linked list to sort
+    num_nodes : int
+        No. of nodes in linked list
+    key : function
+        Returns value to sort node by, given node
+
+    Returns
+    -------
+    head : Node in LinkedList
+        First node of sorted linked list
+    """
+    # Merge sorted chains of width nodes into sorted chains of 2 * width
+    # nodes, until whole list is one sorted chain
+    width = 1
+    while width < num_nodes:
+        new_head = None
+        tail = None
+        current_node = head
+        while current_node is not None:
+            left = current_node
+            right = _split_after(left, width)
+            current_node = _split_after(right, width)
+
+            merged_head, merged_tail = _merge_nodes(left, right, key)
+            if tail is None:
+                new_head = merged_head
+            else:
+                tail.next_node = merged_head
+            tail = merged_tail
+
+        head = new_head
+        width *= 2
+
+    return head
+
+
+def _remove_adjacent_dups(head, key):
+    """Remove nodes with same key as the node before them
+
+    Parameters
+    ----------
+    head : Node in LinkedList
+        First node of linked list
+    key : function
+        Returns value to compare node by, given node
+    """
+    current_node = head
+    while current_node.next_node is not None:
+        if key(current_node.next_node) == key(current_node):
+            current_node.next_node = current_node.next_node.next_node
+        else:
+            current_node = current_node.next_node
+
+
+def remove_dups_v3(linked_list, keep_order=True):
+    """Remove duplicate values from a linked list
+
+    Constraint: no temporary buffer is allowed, as for remove_dups_v2, but
+    O(n log n) time, rather than O(n^2) time. Values must allow comparison.
+
+    If linked list is already sorted, duplicates are adjacent, so they are
+    removed in a single pass, in O(n) time and O(1) space. Otherwise, nodes are
+    sorted by value with a stable merge sort that only relinks nodes, so the
+    first occurrence of each value comes first in its run of duplicates, and
+    the rest of the run is removed.
+
+    Parameters
+    ----------
+    linked_list : LinkedList
+        Linked list to remove duplicates from
+    keep_order : bool
+        If True, remaining nodes are left in their original order. To do so,
+        each node's data is tagged with its original position while sorting,
+        then nodes are sorted back by tag, which uses O(n) space for tags. If
+        False, remaining nodes are left sorted by value, in O(1) space.
+
+    Returns
+    -------
+    linked_list : LinkedList
+        Input linked list, with duplicates removed
+    """
+    # Handle empty linked list
+    if linked_list.head is None:
+        return linked_list
+
+    # Count nodes, checking if linked list is already sorted
+    num_nodes = 1
+    is_sorted = True
+    current_node = linked_list.head
+    while current_node.next_node is not None:
+        if current_node.next_node.data < current_node.data:
+            is_sorted = False
+        current_node = current_node.next_node
+        num_nodes += 1
+
+    if is_sorted:
+        _remove_adjacent_dups(linked_list.head, lambda node: node.data)
+        return linked_list
+
+    if not keep_order:
+        linked_list.head = _merge_sort_nodes(
+            linked_list.head, num_nodes, lambda node: node.data
+        )
+        _remove_adjacent_dups(linked_list.head, lambda node: node.data)
+        return linked_list
+
+    # Tag data with original position: (position, data)
+    current_node = linked_list.head
+    for position in range(num_nodes):
+        current_node.data = (position, current_node.data)
+        current_node = current_node.next_node
+
+    # Sort by data, remove duplicates, then sort back by position
+    linked_list.head = _merge_sort_nodes(
+        linked_list.head, num_nodes, lambda node: node.data[1]
+    )
+    _remove_adjacent_dups(linked_list.head, lambda node: node.data[1])
+    linked_list.head = _merge_sort_nodes(
+        linked_list.head, num_nodes, lambda node: node.data[0]
+    )
+
+    # Remove tags
+    current_node = linked_list.head
+    while current_node is not None:
+        current_node.data = current_node.data[1]
+        current_node = current_node.next_node
+
+    return linked_list
+
+
+class BloomFilter():
+    """Class to represent a Bloom filter: a fixed-size bit array that can
+    tell if a value has definitely not been added, or has probably been added
+    """
+
+    def __init__(self, num_bits, num_hashes):
+        """Initialise bit array
+
+        Parameters
+        ----------
+        num_bits : int
+            Size of bit array
+        num_hashes : int
+            No. of bits set per value added
+        """
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray(-(-num_bits // 8))  # round up
+
+    @staticmethod
+    def optimal_num_bits(num_values, false_positive_rate):
+        """Find size of bit array that gives false_positive_rate, once
+        num_values values have been added, with optimal no. of hashes
+
+        Parameters
+        ----------
+        num_values : int
+            Expected no. of values to add
+        false_positive_rate : float
+            Target probability that might_contain returns True for a value
+            that hasn't been added
+
+        Returns
+        -------
+        int
+            Size of bit array, i.e. -n ln(p) / ln(2)^2
+        """
+        return max(1, math.ceil(
+            -num_values * math.log(false_positive_rate) / math.log(2) ** 2
+        ))
+
+    def _bit_indices(self, value):
+        """Find indices of bits that represent value, using double hashing
+
+        Parameters
+        ----------
+        value : any
+            Any hashable Python object
+
+        Returns
+        -------
+        list of int
+            Indices of bits in bit array
+        """
+        hash_1 = hash(value)
+        hash_2 = hash((value, self.num_bits)) | 1  # odd, so never 0
+        return [
+            (hash_1 + i * hash_2) % self.num_bits
+            for i in range(self.num_hashes)
+        ]
+
+    def add(self, value):
+        """Add value to filter
+
+        Parameters
+        ----------
+        value : any
+            Any hashable Python object
+        """
+        for index in self._bit_indices(value):
+            self.bits[index >> 3] |= 1 << (index & 7)
+
+    def might_contain(self, value):
+        """Check if value might have been added to filter
+
+        Parameters
+        ----------
+        value : any
+            Any hashable Python object
+
+        Returns
+        -------
+        bool
+            False if value has definitely not been added, True otherwise
+        """
+        for index in self._bit_indices(value):
+            if not self.bits[index >> 3] & (1 << (index & 7)):
+                return False
+
+        return True
+
+
+class SortedRunFile():
+    """Class to represent a sorted run of keys, stored in a temporary file on
+    disk, with a sparse index in memory for lookups
+
+    Each record in file is a 4 byte length, followed by key. Every
+    index_interval-th key is kept in memory with its file offset, so a lookup
+    is a binary search of the sparse index, then a scan of at most
+    index_interval records.
+    """
+
+    def __init__(self, keys, index_interval, directory=None, is_sorted=False):
+        """Write keys to a temporary file, in sorted order
+
+        Parameters
+        ----------
+        keys : iterable of bytes
+            Keys to store
+        index_interval : int
+            No. of records between keys kept in memory
+        directory : str
+            Directory to create temporary file in. Defaults to system default.
+        is_sorted : bool
+            True if keys are already sorted, so can be streamed straight to
+            file, rather than sorted in memory first
+        """
+        self.index_interval = index_interval
+        self.directory = directory
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self.index_keys = []
+        self.index_offsets = []
+        self.num_keys = 0
+
+        if not is_sorted:
+            keys = sorted(keys)
+
+        for i, key in enumerate(keys):
+            if i % index_interval == 0:
+                self.index_keys.append(key)
+                self.index_offsets.append(self.file.tell())
+            self.file.write(struct.pack('<I', len(key)))
+            self.file.write(key)
+            self.num_keys += 1
+
+        self.file.flush()
+
+    def iter_keys(self):
+        """Read keys from file, in sorted order
+
+        Yields
+        ------
+        bytes
+            Each key in run
+        """
+        self.file.seek(0)
+        length_bytes = self.file.read(4)
+        while length_bytes:
+            yield self.file.read(struct.unpack('<I', length_bytes)[0])
+            length_bytes = self.file.read(4)
+
+    def merge(self, other):
+        """Merge this run with another run, into a new run, closing both
+
+        Keys are streamed from both files, so merging doesn't need to hold
+        either run in memory.
+
+        Parameters
+        ----------
+        other : SortedRunFile
+            Run to merge with
+
+        Returns
+        -------
+        merged_run : SortedRunFile
+            Run containing keys from both runs
+        """
+        merged_run = SortedRunFile(
+            heapq.merge(self.iter_keys(), other.iter_keys()),
+            self.index_interval, self.directory, is_sorted=True
+        )
+        self.close()
+        other.close()
+
+        return merged_run
+
+    def iter_with_prefix(self, prefix):
+        """Find keys in run that start with prefix
+
+        Parameters
+        ----------
+        prefix : bytes
+            Prefix to look up
+
+        Yields
+        ------
+        bytes
+            Each key in run that starts with prefix, in sorted order
+        """
+        if not self.index_keys:
+            return
+
+        # Keys starting with prefix are all >= prefix, so could start in the
+        # block before first indexed key >= prefix
+        index = max(bisect.bisect_left(self.index_keys, prefix) - 1, 0)
+
+        self.file.seek(self.index_offsets[index])
+        length_bytes = self.file.read(4)
+        while length_bytes:
+            record_key = self.file.read(struct.unpack('<I', length_bytes)[0])
+            if record_key.startswith(prefix):
+                yield record_key
+            # Keys are sorted, so no more keys can start with prefix
+            elif record_key > prefix:
+                return
+            length_bytes = self.file.read(4)
+
+    def close(self):
+        """Close, and so delete, temporary file
+        """
+        self.file.close()
+
+
+# Max no. of hashes per value used by remove_dups_bounded's Bloom filter
+MAX_BLOOM_HASHES = 8
+
+# No. of bytes of hash at start of each key in remove_dups_bounded's runs
+HASH_PREFIX_SIZE = 8
+
+
+def _hash_prefix(value):
+    """Encode hash of value as bytes, which sort in the same order as hash
+
+    Parameters
+    ----------
+    value : any
+        Any hashable Python object
+
+    Returns
+    -------
+    bytes
+        HASH_PREFIX_SIZE bytes
+    """
+    return (hash(value) % 2**(8 * HASH_PREFIX_SIZE)).to_bytes(
+        HASH_PREFIX_SIZE, 'big'
+    )
+
+
+def _run_key(value):
+    """Create key to store value in a run file: hash of value, then value
+    pickled
+
+    Pickled bytes aren't canonical (equal values can pickle differently, e.g.
+    1 and 1.0), but equal values always have equal hashes, so runs are
+    sorted, and looked up, by hash.
+
+    Parameters
+    ----------
+    value : any
+        Any hashable, picklable Python object
+
+    Returns
+    -------
+    bytes
+        Key of value
+    """
+    return _hash_prefix(value) + pickle.dumps(value)
+
+
+def remove_dups_bounded(linked_list, bloom_filter_bytes=None,
+                        false_positive_rate=0.01, max_buffer_values=100000,
+                        index_interval=64, spill_directory=None):
+    """Remove duplicate values from a linked list, with bounded memory
+
+    Same approach as remove_dups, but rather than keeping every value found
+    in a hash table, values are added to a fixed-size Bloom filter. Exact
+    checks are only needed for values the filter says are probable
+    duplicates. For exact checks, values found are kept in an in-memory
+    buffer, which is sorted and spilled to a run file on disk when it is
+    full. Runs are merged whenever the newest run is as big as the one before
+    it, so there are only O(log n) runs to check.
+
+    Run files are sorted by hash of each value, so a lookup unpickles just
+    the values on disk with the same hash, and compares them with ==. So the
+    result is the same as remove_dups, whatever the memory settings.
+
+    Parameters
+    ----------
+    linked_list : LinkedList
+        Linked list to remove duplicates from. Values must be hashable and
+        picklable.
+    bloom_filter_bytes : int
+        Size of Bloom filter, in bytes. By default, it is sized from the no.
+        of nodes to give false_positive_rate: about 1.2 bytes per node for
+        1%, e.g. 60 MB for 50M nodes. A smaller, fixed size bounds memory,
+        but false positives (which each need a lookup on disk) rise quickly
+        once there are more than about 8 nodes per byte of filter.
+    false_positive_rate : float
+        Target false positive rate of Bloom filter, if bloom_filter_bytes
+        isn't given
+    max_buffer_values : int
+        Max no. of values to keep in memory before spilling to disk
+    index_interval : int
+        No. of values on disk per value kept in each run file's sparse index
+    spill_directory : str
+        Directory to write run files to. Defaults to system default.
+
+    Returns
+    -------
+    linked_list : LinkedList
+        Input linked list, with duplicates removed
+    """
+    # Handle empty linked list
+    if linked_list.head is None:
+        return linked_list
+
+    # Count nodes, to choose Bloom filter size and optimal no. of hashes. Cap
+    # no. of hashes, since each hash costs time, and false positives are
+    # already rare by then.
+    num_nodes = 0
+    current_node = linked_list.head
+    while current_node is not None:
+        num_nodes += 1
+        current_node = current_node.next_node
+    if bloom_filter_bytes is None:
+        num_bits = BloomFilter.optimal_num_bits(
+            num_nodes, false_positive_rate
+        )
+    else:
+        num_bits = bloom_filter_bytes * 8
+    num_hashes = min(
+        max(1, round(num_bits / num_nodes * math.log(2))), MAX_BLOOM_HASHES
+    )
+    bloom_filter = BloomFilter(num_bits, num_hashes)
+
+    # Values found since last spill, and run files of spilled values
+    buffer = set()
+    runs = []
+
+    def is_duplicate(value):
+        """Check value against values found so far, adding it if not found
+        """
+        # Bloom filter has no false negatives, so skip exact check if value
+        # definitely hasn't been found
+        if bloom_filter.might_contain(value):
+            if value in buffer:
+                return True
+            prefix = _hash_prefix(value)
+            for run in runs:
+                for key in run.iter_with_prefix(prefix):
+                    if pickle.loads(key[HASH_PREFIX_SIZE:]) == value:
+                        return True
+        else:
+            bloom_filter.add(value)
+
+        buffer.add(value)
+        # Spill buffer to disk, if full
+        if len(buffer) >= max_buffer_values:
+            runs.append(SortedRunFile(
+                map(_run_key, buffer), index_interval, spill_directory
+            ))
+            buffer.clear()
+            while len(runs) > 1 and runs[-2].num_keys <= runs[-1].num_keys:
+                runs.append(runs.pop(-2).merge(runs.pop()))
+
+        return False
+
+    try:
+        # Start at head
+        current_node = linked_list.head
+        is_duplicate(current_node.data)
+
+        # Walk through linked list, from head to tail, as in remove_dups
+        while current_node.next_node is not None:
+            next_node = current_node.next_node
+            if is_duplicate(next_node.data):
+                # Delete next node
+                current_node.next_node = next_node.next_node
+            else:
+                # Go to next node
+                current_node = next_node
+    finally:
+        for run in runs:
+            run.close()
+
+    return linked_list
+
+
+def benchmark_remove_dups_bounded(num_nodes=200000):
+    """Print peak memory and throughput of remove_dups_bounded, with various
+    memory limits, compared with remove_dups.
+
+    Parameters
+    ----------
+    num_nodes : int
+        No. of nodes in linked list; about half are duplicates
+    """
+    values = [random.randrange(num_nodes // 2) for _ in range(num_nodes)]
+
+    functions = {
+        'remove_dups': remove_dups,
+        'bounded, 1% filter, no spill': lambda linked_list: (
+            remove_dups_bounded(linked_list, max_buffer_values=num_nodes)
+        ),
+        'bounded, 1% filter, 10k buffer': lambda linked_list: (
+            remove_dups_bounded(linked_list, max_buffer_values=10000)
+        ),
+        'bounded, 64 kB filter, 10k buffer': lambda linked_list: (
+            remove_dups_bounded(
+                linked_list, bloom_filter_bytes=2**16, max_buffer_values=10000
+            )
+        ),
+    }
+
+    print('{:,} nodes'.format(num_nodes))
+    for name, function in functions.items():
+        linked_list = LinkedList(input_arr=values)
+        start = time.perf_counter()
+        function(linked_list)
+        function_time = time.perf_counter() - start
+
+        # Measure memory in separate run, since tracing slows it down
+        linked_list = LinkedList(input_arr=values)
+        tracemalloc.start()
+        function(linked_list)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print('    {:<36} {:>8,.0f} kB peak, {:>10,.0f} nodes/s'.format(
+            name + ':', peak_memory / 2**10, num_nodes / function_time
+        ))
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -114,6 +790,26 @@ class Test(unittest.TestCase):
         (LinkedList(input_arr=[]), LinkedList(input_arr=[])),
     ]
 
+    @staticmethod
+    def make_data():
+        """Create new test case inputs, and expected outputs, as Python lists,
+        since other tests remove duplicates from self.data in place
+
+        Returns
+        -------
+        list of tuple
+            (input values, expected output values) pairs
+        """
+        return [
+            ([1, 2, 2], [1, 2]),
+            ([1, 2, 3], [1, 2, 3]),
+            ([1], [1]),
+            (['a', 'b', 'b'], ['a', 'b']),
+            (list('abbacdeefaab'), list('abcdef')),
+            ([], []),
+            ([3, 3, 3, 1, 3, 2, 1], [3, 1, 2]),
+        ]
+
     def test_remove_dups(self):
         for test_input, test_output in self.data:
             self.assertEqual(
@@ -126,7 +822,123 @@ class Test(unittest.TestCase):
                 remove_dups(test_input).__str__(), test_output.__str__()
             )
 
+    def test_remove_dups_ArrayLinkedList(self):
+        data = [
+            ([1, 2, 2], [1, 2]),
+            (list('abbacdeefaab'), list('abcdef')),
+            ([], []),
+        ]
+        for test_input, test_output in data:
+            linked_list = ArrayLinkedList(input_arr=test_input)
+            self.assertEqual(list(remove_dups(linked_list)), test_output)
+
+    def test_remove_dups_v3(self):
+        for test_input, test_output in self.make_data():
+            for keep_order in [True, False]:
+                expected = test_output if keep_order else sorted(test_output)
+                self.assertEqual(
+                    remove_dups_v3(
+                        LinkedList(input_arr=test_input), keep_order
+                    ).__str__(),
+                    LinkedList(input_arr=expected).__str__()
+                )
+
+        # Test unsorted linked lists, keeping and not keeping order
+        values = [5, 3, 5, 1, 3, 2, 1, 4, 5]
+        self.assertEqual(
+            remove_dups_v3(LinkedList(input_arr=values)).__str__(),
+            LinkedList(input_arr=[5, 3, 1, 2, 4]).__str__()
+        )
+        self.assertEqual(
+            remove_dups_v3(
+                LinkedList(input_arr=values), keep_order=False
+            ).__str__(),
+            LinkedList(input_arr=[1, 2, 3, 4, 5]).__str__()
+        )
+
+        # Test first occurrence of each value is the node that is kept
+        linked_list = LinkedList(input_arr=values)
+        first_nodes = []
+        current_node = linked_list.head
+        while current_node is not None:
+            if current_node.data not in [n.data for n in first_nodes]:
+                first_nodes.append(current_node)
+            current_node = current_node.next_node
+        remove_dups_v3(linked_list)
+        current_node = linked_list.head
+        for first_node in first_nodes:
+            self.assertIs(current_node, first_node)
+            current_node = current_node.next_node
+
+    def test_BloomFilter(self):
+        num_values = 10000
+        num_bits = BloomFilter.optimal_num_bits(num_values, 0.01)
+        self.assertEqual(num_bits, 95851)
+
+        # Test there are no false negatives, and false positive rate is near
+        # target
+        bloom_filter = BloomFilter(num_bits, 7)
+        for value in range(num_values):
+            bloom_filter.add(value)
+        for value in range(num_values):
+            self.assertTrue(bloom_filter.might_contain(value))
+        num_false_positives = sum(
+            bloom_filter.might_contain(value)
+            for value in range(num_values, 2 * num_values)
+        )
+        self.assertLess(num_false_positives, 0.02 * num_values)
+
+    def test_remove_dups_bounded(self):
+        for test_input, test_output in self.make_data():
+            # Use tiny filter and buffer, to force false positives and spills
+            self.assertEqual(
+                remove_dups_bounded(
+                    LinkedList(input_arr=test_input), bloom_filter_bytes=1,
+                    max_buffer_values=2, index_interval=2
+                ).__str__(),
+                LinkedList(input_arr=test_output).__str__()
+            )
+
+        # Test duplicates of values that were spilled to different runs
+        # (and merged runs), rather than still in buffer
+        values = list(range(10)) + list(range(9, -1, -1)) + [4, 11, 0, 11]
+        for max_buffer_values in [1, 2, 3]:
+            self.assertEqual(
+                remove_dups_bounded(
+                    LinkedList(input_arr=values), bloom_filter_bytes=1,
+                    max_buffer_values=max_buffer_values, index_interval=2
+                ).__str__(),
+                LinkedList(input_arr=list(range(10)) + [11]).__str__()
+            )
+
+        values = [i % 37 for i in range(500)]
+        self.assertEqual(
+            remove_dups_bounded(
+                LinkedList(input_arr=values), bloom_filter_bytes=4,
+                max_buffer_values=5, index_interval=3
+            ).__str__(),
+            LinkedList(input_arr=list(range(37))).__str__()
+        )
+
+        # Test values that are equal, but pickle differently, are removed
+        # after being spilled to disk, the same as by remove_dups
+        x = 'ab' * 3
+        for values in [
+                [(x, x), 0, ('ababab', ''.join(['ab'] * 3))],
+                [1, 1.0, True, 2, 2.0]]:
+            for max_buffer_values in [1, 2, 100]:
+                self.assertEqual(
+                    remove_dups_bounded(
+                        LinkedList(input_arr=values), bloom_filter_bytes=1,
+                        max_buffer_values=max_buffer_values, index_interval=1
+                    ).__str__(),
+                    remove_dups(LinkedList(input_arr=values)).__str__()
+                )
+
 
 if __name__ == '__main__':
 
-    unittest.main()
+    if '--benchmark' in sys.argv:
+        benchmark_remove_dups_bounded()
+    else:
+        unittest.main()
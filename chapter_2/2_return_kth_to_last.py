@@ -1,7 +1,10 @@
+import bisect
 import unittest
 
 from data_structures.linked_lists.singly_linked_list import LinkedList
 
+from array_linked_list import NULL_INDEX, ArrayLinkedList
+
 
 def return_kth_to_last(linked_list, k):
     """Find kth to last element in linked list and return it
@@ -25,6 +28,9 @@ def return_kth_to_last(linked_list, k):
     if linked_list.head is None:
         raise Exception('Invalid query. LinkedList is empty.')
 
+    if isinstance(linked_list, ArrayLinkedList):
+        return _return_kth_to_last_array(linked_list, k)
+
     # Set pointer 1 to head of linked list
     p1 = linked_list.head
     # Initialise counter
@@ -49,6 +55,28 @@ def return_kth_to_last(linked_list, k):
     return p2.data
 
 
+def _return_kth_to_last_array(linked_list, k):
+    """Same as return_kth_to_last, for a non-empty ArrayLinkedList, walking
+    node indices, rather than creating an ArrayNode per node
+    """
+    next_indices = linked_list.next_indices
+
+    # Move pointer 1 to element k
+    p1 = linked_list.head_index
+    for _ in range(k):
+        p1 = next_indices[p1]
+        if p1 == NULL_INDEX:
+            raise AttributeError('k is too large for the linked list given')
+
+    # Move both pointers until pointer 1 reaches end of linked list
+    p2 = linked_list.head_index
+    while next_indices[p1] != NULL_INDEX:
+        p1 = next_indices[p1]
+        p2 = next_indices[p2]
+
+    return linked_list.values[p2]
+
+
 def recursive_helper(current_node, k):
     """Recursively look for kth to last node, recursing until end of linked
     list, then going back up recursion stack, incrementing k until kth to last
@@ -125,6 +153,304 @@ def return_kth_to_last_v2(linked_list, k):
         return value
 
 
+def _last_values(current_node, num_values):
+    """Walk linked list from current_node to end, keeping the last num_values
+    values in a ring buffer
+
+    Ring buffer grows as nodes are walked, up to num_values, so a num_values
+    much larger than the linked list doesn't allocate a huge buffer.
+
+    Parameters
+    ----------
+    current_node : Node in LinkedList
+        Node to start walk from
+    num_values : int
+        Size of ring buffer
+
+    Returns
+    -------
+    ring_buffer : list of any
+        Last min(num_values, num_nodes) values. Value of node i (counting
+        from current_node) is at index i % num_values.
+    num_nodes : int
+        No. of nodes walked through
+    """
+    ring_buffer = []
+    num_nodes = 0
+    while current_node is not None:
+        if num_nodes < num_values:
+            ring_buffer.append(current_node.data)
+        else:
+            ring_buffer[num_nodes % num_values] = current_node.data
+        num_nodes += 1
+        current_node = current_node.next_node
+
+    return ring_buffer, num_nodes
+
+
+def kth_to_last_many(linked_list, ks):
+    """Find kth to last element in linked list, for each k in ks
+
+    Walks linked list once, keeping the last max(ks) + 1 values in a ring
+    buffer, rather than walking it once per k.
+
+    Parameters
+    ----------
+    linked_list : LinkedList
+        Linked list to search through
+    ks : iterable of int
+        Kth to last elements to find
+
+    Returns
+    -------
+    list of any
+        Value at kth to last element in linked list, for each k in ks
+    """
+    ks = list(ks)
+
+    # Handle special case of empty linked list
+    if linked_list.head is None:
+        raise Exception('Invalid query. LinkedList is empty.')
+
+    # Handle special case of no queries
+    if not ks:
+        return []
+
+    if min(ks) < 0:
+        raise Exception('k must be non-negative')
+
+    ring_size = max(ks) + 1
+    ring_buffer, num_nodes = _last_values(linked_list.head, ring_size)
+
+    values = []
+    for k in ks:
+        if k >= num_nodes:
+            raise Exception('k is too large for the linked list given')
+        values.append(ring_buffer[(num_nodes - 1 - k) % ring_size])
+
+    return values
+
+
+def iterative_helper(current_node, k):
+    """Iterative replacement for recursive_helper, with same inputs and
+    outputs, which doesn't overflow the stack on long linked lists.
+
+    Keeps the last k + 1 values in a ring buffer, rather than keeping every
+    node on the recursion stack.
+
+    Parameters
+    ----------
+    current_node : Node in LinkedList
+        First node to search from
+    k : int
+        Kth to last element to find
+
+    Returns
+    -------
+    index : int
+        -1 if kth to last node was found, otherwise no. of nodes searched
+    value : any
+        Value at kth to last element, or None if not found
+    """
+    if k < 0:
+        raise Exception('k must be non-negative')
+
+    ring_buffer, num_nodes = _last_values(current_node, k + 1)
+
+    if k >= num_nodes:
+        return num_nodes, None
+
+    return -1, ring_buffer[(num_nodes - 1 - k) % (k + 1)]
+
+
+def return_kth_to_last_v3(linked_list, k):
+    """Same as return_kth_to_last_v2, but using iterative_helper rather than
+    recursive_helper, so works on linked lists of any length.
+    """
+    # Handle special case of empty linked list
+    if linked_list.head is None:
+        raise Exception('Invalid query. LinkedList is empty.')
+
+    index, value = iterative_helper(linked_list.head, k)
+
+    # Check for kth to last element not being found
+    if index != -1:
+        raise Exception('k is too large for the linked list given')
+    else:
+        return value
+
+
+class IndexedLinkedList(LinkedList):
+    """Class to represent a linked list that tracks its length, and keeps a
+    sparse index of nodes, for sub-linear kth to last lookups
+
+    Every roughly sqrt(n) nodes, a node is kept as a checkpoint, along with
+    its position counted from the tail (tail is position 0). Positions from
+    the tail don't change when nodes are prepended, so prepend is O(1). A
+    lookup jumps to the nearest checkpoint at or above the target position
+    (found by binary search), then walks at most sqrt(n) nodes, so is
+    O(sqrt(n)) time, rather than O(n).
+
+    Note: only prepend and delete keep the index consistent, so other methods
+    inherited from LinkedList that change nodes shouldn't be used.
+    """
+
+    def __init__(self, input_arr=()):
+        """Initialise empty index, then insert input_arr
+
+        Parameters
+        ----------
+        input_arr : iterable
+            Values to store in linked list, in order from head to tail
+        """
+        super().__init__()
+        self.length = 0
+        # Max no. of nodes between checkpoints
+        self.interval = 1
+        # Checkpoint nodes, and their positions from tail, in increasing order
+        # of position
+        self.checkpoints = []
+        self.checkpoint_positions = []
+
+        for data in reversed(list(input_arr)):
+            self.prepend(data)
+
+    def prepend(self, data):
+        """Add new node, containing data, to start of linked list, adding it
+        to the index if far enough from the last checkpoint
+
+        Parameters
+        ----------
+        data : any
+            Data to store in node
+        """
+        super().prepend(data)
+        self.length += 1
+        head_position = self.length - 1
+
+        if (not self.checkpoints or
+                head_position - self.checkpoint_positions[-1] >=
+                self.interval):
+            self.checkpoints.append(self.head)
+            self.checkpoint_positions.append(head_position)
+
+        # Double interval as length grows, keeping every other checkpoint, so
+        # there are always O(sqrt(n)) checkpoints
+        if self.length > (2 * self.interval) ** 2:
+            self.interval *= 2
+            self.checkpoints = self.checkpoints[::2]
+            self.checkpoint_positions = self.checkpoint_positions[::2]
+
+    def _find_node(self, position):
+        """Find node at position from tail, using index
+
+        Parameters
+        ----------
+        position : int
+            Position of node, counted from tail
+
+        Returns
+        -------
+        current_node : Node in LinkedList
+            Node at position
+        """
+        if position < 0 or position >= self.length:
+            raise Exception('k is too large for the linked list given')
+
+        # Find nearest checkpoint at or above position, or use head if there
+        # isn't one
+        index = bisect.bisect_left(self.checkpoint_positions, position)
+        if index == len(self.checkpoints):
+            current_node = self.head
+            current_position = self.length - 1
+        else:
+            current_node = self.checkpoints[index]
+            current_position = self.checkpoint_positions[index]
+
+        # Walk towards tail, until position is reached
+        while current_position > position:
+            current_node = current_node.next_node
+            current_position -= 1
+
+        return current_node
+
+    def kth_to_last(self, k):
+        """Find kth to last element in linked list and return it
+
+        Parameters
+        ----------
+        k : int
+            Kth to last element to find
+
+        Returns
+        -------
+        any
+            Value at kth to last element in linked list
+        """
+        return self._find_node(k).data
+
+    def kth_from_head(self, k):
+        """Find kth element in linked list (counting from 0 at head) and
+        return it
+
+        Parameters
+        ----------
+        k : int
+            Kth element to find
+
+        Returns
+        -------
+        any
+            Value at kth element in linked list
+        """
+        return self._find_node(self.length - 1 - k).data
+
+    def delete(self, k):
+        """Delete kth element in linked list (counting from 0 at head),
+        updating index
+
+        Unlike delete_middle_node, any node, including the head and tail, can
+        be deleted, since the node before it is found using the index.
+
+        Parameters
+        ----------
+        k : int
+            Index of element to delete
+        """
+        position = self.length - 1 - k
+        node = self._find_node(position)
+
+        # Unlink node
+        if k == 0:
+            self.head = node.next_node
+            previous_node = None
+        else:
+            previous_node = self._find_node(position + 1)
+            previous_node.next_node = node.next_node
+        self.length -= 1
+
+        # Nodes between head and deleted node are now one position closer to
+        # tail
+        index = bisect.bisect_left(self.checkpoint_positions, position)
+        for i in range(index, len(self.checkpoints)):
+            self.checkpoint_positions[i] -= 1
+
+        # Replace deleted node, if it was a checkpoint, with node before it,
+        # which is now at its position
+        if (index < len(self.checkpoints) and
+                self.checkpoints[index] is node):
+            next_index_is_previous_node = (
+                index + 1 < len(self.checkpoints) and
+                self.checkpoints[index + 1] is previous_node
+            )
+            if previous_node is None or next_index_is_previous_node:
+                del self.checkpoints[index]
+                del self.checkpoint_positions[index]
+            else:
+                self.checkpoints[index] = previous_node
+                self.checkpoint_positions[index] = position
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -149,6 +475,16 @@ class Test(unittest.TestCase):
         with self.assertRaises(AttributeError):
             return_kth_to_last(LinkedList(input_arr=[1, 2, 3, 4, 5]), 10)
 
+    def test_return_kth_to_last_ArrayLinkedList(self):
+        for test_input, test_output in self.data:
+            linked_list = ArrayLinkedList(input_arr=[1, 2, 3, 4, 5])
+            self.assertEqual(
+                return_kth_to_last(linked_list, test_input[1]), test_output
+            )
+
+        with self.assertRaises(AttributeError):
+            return_kth_to_last(ArrayLinkedList(input_arr=[1, 2, 3]), 10)
+
     def test_return_kth_to_last_v2(self):
         # Test data inputs and outputs
         for test_input, test_output in self.data:
@@ -166,6 +502,90 @@ class Test(unittest.TestCase):
         with self.assertRaises(Exception):
             return_kth_to_last_v2(LinkedList(input_arr=[1, 2, 3, 4, 5]), 10)
 
+    def test_kth_to_last_many(self):
+        linked_list = LinkedList(input_arr=[1, 2, 3, 4, 5])
+        self.assertEqual(
+            kth_to_last_many(linked_list, [2, 0, 4, 0]), [3, 5, 1, 5]
+        )
+        self.assertEqual(kth_to_last_many(linked_list, []), [])
+
+        # Test empty LinkedList
+        with self.assertRaises(Exception):
+            kth_to_last_many(LinkedList(), [0])
+
+        # Test k that is too large, including too large to allocate a ring
+        # buffer of size k + 1
+        for ks in [[1, 5], [10**9], [0, 10**18]]:
+            with self.assertRaisesRegex(Exception, 'k is too large'):
+                kth_to_last_many(linked_list, ks)
+
+        # Test negative k
+        for ks in [[-1], [-1, 3]]:
+            with self.assertRaisesRegex(Exception, 'non-negative'):
+                kth_to_last_many(linked_list, ks)
+
+    def test_iterative_helper(self):
+        linked_list = LinkedList(input_arr=[1, 2, 3, 4, 5])
+        self.assertEqual(iterative_helper(linked_list.head, 4), (-1, 1))
+        self.assertEqual(iterative_helper(linked_list.head, 10**9), (5, None))
+        with self.assertRaises(Exception):
+            iterative_helper(linked_list.head, -1)
+
+    def test_return_kth_to_last_v3(self):
+        # Test data inputs and outputs
+        for test_input, test_output in self.data:
+            self.assertEqual(
+                return_kth_to_last_v3(
+                    test_input[0], test_input[1]
+                ), test_output
+            )
+
+        # Test empty LinkedList
+        with self.assertRaises(Exception):
+            return_kth_to_last_v3(LinkedList(), 0)
+
+        # Test k that is too large
+        with self.assertRaises(Exception):
+            return_kth_to_last_v3(LinkedList(input_arr=[1, 2, 3, 4, 5]), 10)
+
+        # Test linked list too long for recursive_helper
+        linked_list = LinkedList()
+        for i in range(100000):
+            linked_list.prepend(i)
+        self.assertEqual(return_kth_to_last_v3(linked_list, 10), 10)
+
+    def test_IndexedLinkedList(self):
+        values = list(range(50))
+        linked_list = IndexedLinkedList(input_arr=values)
+
+        # Test lookups from both ends
+        for k in range(len(values)):
+            self.assertEqual(linked_list.kth_to_last(k), values[-1 - k])
+            self.assertEqual(linked_list.kth_from_head(k), values[k])
+        with self.assertRaises(Exception):
+            linked_list.kth_to_last(len(values))
+
+        # Test index stays consistent after prepends and deletes, including
+        # head and tail
+        for k in [0, 49, 10, 10, 11, 30, 0]:
+            linked_list.delete(k)
+            del values[k]
+            linked_list.prepend(-k)
+            values.insert(0, -k)
+            for i in range(len(values)):
+                self.assertEqual(linked_list.kth_to_last(i), values[-1 - i])
+        self.assertEqual(
+            linked_list.__str__(), LinkedList(input_arr=values).__str__()
+        )
+
+        # Test deleting every node
+        while values:
+            linked_list.delete(len(values) // 2)
+            del values[len(values) // 2]
+            for i in range(len(values)):
+                self.assertEqual(linked_list.kth_from_head(i), values[i])
+        self.assertIsNone(linked_list.head)
+
 
 if __name__ == '__main__':
 
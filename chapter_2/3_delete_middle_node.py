@@ -2,6 +2,8 @@ import unittest
 
 from data_structures.linked_lists.singly_linked_list import LinkedList
 
+from array_linked_list import ArrayLinkedList
+
 
 def delete_middle_node(node):
     """Given only access to middle node (not start or end node) in a
@@ -19,6 +21,61 @@ def delete_middle_node(node):
     node.next_node = node.next_node.next_node
 
 
+def delete_nodes(linked_list, nodes_or_predicate):
+    """Delete a set of nodes from a LinkedList, in a single pass
+
+    Unlike delete_middle_node, nodes are unlinked, rather than having their
+    successor's data copied into them, so any node, including the head and
+    tail, can be deleted, and no data is copied.
+
+    Parameters
+    ----------
+    linked_list : LinkedList
+        Linked list to delete nodes from
+    nodes_or_predicate : iterable of Node in LinkedList, or function
+        Either the nodes to delete, or a function that takes a node, and
+        returns True if it should be deleted
+
+    Returns
+    -------
+    num_deleted : int
+        No. of nodes deleted
+    """
+    if callable(nodes_or_predicate):
+        should_delete = nodes_or_predicate
+    else:
+        # Store nodes in a set, for O(1) lookup
+        nodes_to_delete = set(nodes_or_predicate)
+
+        def should_delete(node):
+            return node in nodes_to_delete
+
+    num_deleted = 0
+
+    # Delete nodes at head, until head is a node to keep
+    while linked_list.head is not None and should_delete(linked_list.head):
+        linked_list.head = linked_list.head.next_node
+        num_deleted += 1
+
+    # Handle linked list that is now empty
+    if linked_list.head is None:
+        return num_deleted
+
+    # Walk through rest of linked list, checking node after current node, so
+    # it can be unlinked
+    current_node = linked_list.head
+    while current_node.next_node is not None:
+        next_node = current_node.next_node
+        if should_delete(next_node):
+            current_node.next_node = next_node.next_node
+            num_deleted += 1
+            # Stick to current_node, since its next_node has changed
+        else:
+            current_node = next_node
+
+    return num_deleted
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -49,6 +106,45 @@ class Test(unittest.TestCase):
                 test_input[0].__str__(), test_output.__str__()
             )
 
+    def test_delete_nodes(self):
+        for linked_list_class in [LinkedList, ArrayLinkedList]:
+            # Test deleting a set of nodes, including head and tail
+            linked_list = linked_list_class(input_arr=[1, 2, 3, 4, 5, 6])
+            nodes = []
+            current_node = linked_list.head
+            while current_node is not None:
+                nodes.append(current_node)
+                current_node = current_node.next_node
+            num_deleted = delete_nodes(
+                linked_list, [nodes[0], nodes[2], nodes[3], nodes[5]]
+            )
+            self.assertEqual(num_deleted, 4)
+            self.assertEqual(
+                linked_list.__str__(),
+                linked_list_class(input_arr=[2, 5]).__str__()
+            )
+
+            # Test deleting with a predicate
+            linked_list = linked_list_class(input_arr=[2, 4, 1, 6, 3, 8])
+            num_deleted = delete_nodes(
+                linked_list, lambda node: node.data % 2 == 0
+            )
+            self.assertEqual(num_deleted, 4)
+            self.assertEqual(
+                linked_list.__str__(),
+                linked_list_class(input_arr=[1, 3]).__str__()
+            )
+
+            # Test deleting every node
+            linked_list = linked_list_class(input_arr=[1, 2])
+            self.assertEqual(delete_nodes(linked_list, lambda node: True), 2)
+            self.assertIsNone(linked_list.head)
+
+    def test_delete_middle_node_ArrayLinkedList(self):
+        linked_list = ArrayLinkedList(input_arr=['a', 'b', 'c', 'd', 'e'])
+        delete_middle_node(linked_list.head.next_node.next_node)
+        self.assertEqual(list(linked_list), ['a', 'b', 'd', 'e'])
+
 
 if __name__ == '__main__':
 
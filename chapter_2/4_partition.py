@@ -1,7 +1,13 @@
+import bisect
+import random
+import sys
+import time
 import unittest
 
 from data_structures.linked_lists.singly_linked_list import LinkedList
 
+from array_linked_list import NULL_INDEX, ArrayLinkedList
+
 # Note: another solution (from book) is to create a new linked list and either
 # prepend or append elements to that depending on if they are less than the
 # partition value (then prepend), or greater (append). Note that for append
@@ -10,6 +16,9 @@ from data_structures.linked_lists.singly_linked_list import LinkedList
 # My solution is similar, but works in place. It is perhaps more verbose, but
 # has same time and space complexity. So essentially as efficient, hence book's
 # solution not implemented.
+# However, both allocate a node per element moved. partition_stable (below) is
+# closer to book's solution, but relinks existing nodes into chains, rather
+# than allocating new ones, which also keeps the partition stable.
 
 
 def partition(linked_list, partition_val):
@@ -33,6 +42,11 @@ def partition(linked_list, partition_val):
     if linked_list.head is None:
         raise Exception('Empty linked list, cannot perform operation')
 
+    # Relink indices of an ArrayLinkedList, rather than creating an ArrayNode
+    # per node
+    if isinstance(linked_list, ArrayLinkedList):
+        return _multi_partition_array(linked_list, [partition_val])
+
     # Keep track of intersection between left and right half of linked list
     # using pointer 1
     p1 = linked_list.head
@@ -62,6 +76,190 @@ def partition(linked_list, partition_val):
     return linked_list
 
 
+def multi_partition(linked_list, pivots):
+    """Partition a linked list into len(pivots) + 1 groups, in one pass,
+    such that group i contains values >= pivots[i - 1] and < pivots[i].
+
+    Nodes are relinked into a chain per group, then the chains are joined, so
+    no nodes are allocated and no data is copied. Partition is stable: within
+    each group, nodes keep their relative order.
+
+    Parameters
+    ----------
+    linked_list : LinkedList
+        Linked list to partition
+    pivots : list of any
+        Sorted partition values. Can be any Python objects that allow
+        comparison.
+
+    Returns
+    -------
+    linked_list : LinkedList
+        Partitioned input linked list
+    """
+    # Handle empty linked list
+    if linked_list.head is None:
+        raise Exception('Empty linked list, cannot perform operation')
+
+    if isinstance(linked_list, ArrayLinkedList):
+        return _multi_partition_array(linked_list, pivots)
+
+    # First and last node of each group's chain
+    heads = [None] * (len(pivots) + 1)
+    tails = [None] * (len(pivots) + 1)
+
+    # Walk through linked list, moving each node to end of its group's chain
+    current_node = linked_list.head
+    while current_node is not None:
+        next_node = current_node.next_node
+        # No. of pivots <= data is index of group
+        group = bisect.bisect_right(pivots, current_node.data)
+        if heads[group] is None:
+            heads[group] = current_node
+        else:
+            tails[group].next_node = current_node
+        tails[group] = current_node
+        current_node = next_node
+
+    # Join chains, in order, skipping empty groups
+    linked_list.head = None
+    last_tail = None
+    for head, tail in zip(heads, tails):
+        if head is None:
+            continue
+        if last_tail is None:
+            linked_list.head = head
+        else:
+            last_tail.next_node = head
+        last_tail = tail
+    last_tail.next_node = None
+
+    return linked_list
+
+
+def _multi_partition_array(linked_list, pivots):
+    """Same as multi_partition, for a non-empty ArrayLinkedList, relinking
+    node indices, rather than creating an ArrayNode per node
+    """
+    values = linked_list.values
+    next_indices = linked_list.next_indices
+
+    # Index of first and last node of each group's chain
+    heads = [NULL_INDEX] * (len(pivots) + 1)
+    tails = [NULL_INDEX] * (len(pivots) + 1)
+
+    # Walk through linked list, moving each node to end of its group's chain
+    index = linked_list.head_index
+    while index != NULL_INDEX:
+        next_index = next_indices[index]
+        group = bisect.bisect_right(pivots, values[index])
+        if heads[group] == NULL_INDEX:
+            heads[group] = index
+        else:
+            next_indices[tails[group]] = index
+        tails[group] = index
+        index = next_index
+
+    # Join chains, in order, skipping empty groups
+    linked_list.head_index = NULL_INDEX
+    last_tail = NULL_INDEX
+    for head, tail in zip(heads, tails):
+        if head == NULL_INDEX:
+            continue
+        if last_tail == NULL_INDEX:
+            linked_list.head_index = head
+        else:
+            next_indices[last_tail] = head
+        last_tail = tail
+    next_indices[last_tail] = NULL_INDEX
+
+    return linked_list
+
+
+def partition_stable(linked_list, partition_val):
+    """Same goal as partition, but without allocating any nodes, and keeping
+    the relative order of nodes on each side of partition_val.
+
+    Parameters
+    ----------
+    linked_list : LinkedList
+        Linked list to partition
+    partition_val : any
+        Any object that can be stored in LinkedList, and allows comparison
+
+    Returns
+    -------
+    linked_list : LinkedList
+        Partitioned input linked list
+    """
+    return multi_partition(linked_list, [partition_val])
+
+
+def _count_new_nodes(function, values, partition_val):
+    """Count nodes in linked list after function has partitioned it, that
+    weren't in it before
+
+    Parameters
+    ----------
+    function : function
+        Partition function to run
+    values : list of any
+        Values to store in linked list
+    partition_val : any
+        Value to partition around
+
+    Returns
+    -------
+    int
+        No. of nodes allocated by function that are in the result
+    """
+    linked_list = LinkedList(input_arr=values)
+
+    # Keep reference to original nodes, so their ids can't be reused
+    original_nodes = []
+    current_node = linked_list.head
+    while current_node is not None:
+        original_nodes.append(current_node)
+        current_node = current_node.next_node
+    original_ids = set(id(node) for node in original_nodes)
+
+    function(linked_list, partition_val)
+
+    num_new_nodes = 0
+    current_node = linked_list.head
+    while current_node is not None:
+        if id(current_node) not in original_ids:
+            num_new_nodes += 1
+        current_node = current_node.next_node
+
+    return num_new_nodes
+
+
+def benchmark_partition_stable(num_nodes=100000):
+    """Print node allocations per element, and time taken, by
+    partition_stable, compared with partition
+
+    Parameters
+    ----------
+    num_nodes : int
+        No. of nodes in linked list
+    """
+    values = [random.randrange(100) for _ in range(num_nodes)]
+
+    print('{:,} nodes'.format(num_nodes))
+    for function in [partition, partition_stable]:
+        linked_list = LinkedList(input_arr=values)
+        start = time.perf_counter()
+        function(linked_list, 50)
+        function_time = time.perf_counter() - start
+
+        num_new_nodes = _count_new_nodes(function, values, 50)
+
+        print('    {:<18} {:.2f} allocations/element, {:.3f}s'.format(
+            function.__name__ + ':', num_new_nodes / num_nodes, function_time
+        ))
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -118,7 +316,74 @@ class Test(unittest.TestCase):
         with self.assertRaises(Exception):
             partition(LinkedList(), 3)
 
+    def test_partition_stable(self):
+        # Use fresh, unpartitioned, inputs, since test_partition partitions
+        # self.data in place
+        data = [
+            ([1, 2, 2, 5, 6, 2], 3),
+            ([5, 3, 1, 6, 2, 7, 0], 4),
+            ([10, 21, 21, 56, 66, 20, 4], 21),
+            ([9, 8, 7, 1, 2, 3], 5),
+            ([1, 2, 3, 1, 2, 3, 5], 20),
+            ([3, 1], 2),
+            ([4], 2),
+        ]
+        for values, partition_val in data:
+            result = partition_stable(
+                LinkedList(input_arr=values), partition_val
+            )
+
+            # Check order is stable
+            expected = (
+                [value for value in values if value < partition_val] +
+                [value for value in values if value >= partition_val]
+            )
+            self.assertEqual(
+                result.__str__(), LinkedList(input_arr=expected).__str__()
+            )
+
+        # Test no nodes are allocated
+        self.assertEqual(
+            _count_new_nodes(partition_stable, [5, 1, 4, 2, 3], 3), 0
+        )
+
+        # Test empty LinkedList
+        with self.assertRaises(Exception):
+            partition_stable(LinkedList(), 3)
+
+    def test_multi_partition(self):
+        values = [7, 1, 9, 4, 3, 8, 2, 5, 6, 0]
+        result = multi_partition(LinkedList(input_arr=values), [3, 6])
+        self.assertEqual(
+            result.__str__(),
+            LinkedList(input_arr=[1, 2, 0, 4, 3, 5, 7, 9, 8, 6]).__str__()
+        )
+
+        # Test groups that end up empty
+        result = multi_partition(LinkedList(input_arr=values), [-1, 20, 30])
+        self.assertEqual(
+            result.__str__(), LinkedList(input_arr=values).__str__()
+        )
+
+        result = multi_partition(ArrayLinkedList(input_arr=values), [5])
+        self.assertEqual(list(result), [1, 4, 3, 2, 0, 7, 9, 8, 5, 6])
+
+    def test_partition_ArrayLinkedList(self):
+        data = [
+            ([1, 2, 2, 5, 6, 2], 3),
+            ([10, 21, 21, 56, 66, 20], 5),
+            ([3, 1], 2),
+        ]
+        for test_input, partition_val in data:
+            linked_list = ArrayLinkedList(input_arr=test_input)
+            result = partition(linked_list, partition_val)
+            self.assertTrue(self._is_partitioned(result, partition_val))
+            self.assertEqual(sorted(result), sorted(test_input))
+
 
 if __name__ == '__main__':
 
-    unittest.main()
+    if '--benchmark' in sys.argv:
+        benchmark_partition_stable()
+    else:
+        unittest.main()
@@ -0,0 +1,338 @@
+"""Struct-of-arrays linked list, for chapter 2 problems
+
+ArrayLinkedList trades speed of the node API for memory: it uses a fraction
+of the memory of LinkedList (16 bytes per node, with a typecode), but each
+step through head/next_node creates a new ArrayNode cursor, so walking it
+through the node API is many times slower than walking a LinkedList. Code
+that walks the whole list should use the index-based helpers instead
+(iterating over the list, iter_indices(), or reading values and next_indices
+directly), which are about as fast as walking a LinkedList. The chapter 2
+algorithms that accept an ArrayLinkedList do this.
+
+Unlinking a node doesn't free its slot in the columns, so a long-lived list
+that deletes often keeps growing. compact() reclaims unlinked slots, at the
+cost of invalidating existing ArrayNodes and indices.
+"""
+import sys
+import time
+import tracemalloc
+import unittest
+from array import array
+
+# Value of next index that represents no next node (i.e. None)
+NULL_INDEX = -1
+
+
+class ArrayNode():
+    """Class to represent a node in an ArrayLinkedList
+
+    Has the same data and next_node attributes as a node in LinkedList, but
+    is just a lightweight cursor: an index into the ArrayLinkedList's columns,
+    created on demand. Reading or writing data and next_node reads or writes
+    the columns.
+    """
+
+    __slots__ = ('linked_list', 'index')
+
+    def __init__(self, linked_list, index):
+        """Input values
+
+        Parameters
+        ----------
+        linked_list : ArrayLinkedList
+            Linked list node is in
+        index : int
+            Index of node in linked list's columns
+        """
+        self.linked_list = linked_list
+        self.index = index
+
+    def __eq__(self, other):
+        """Cursors are equal if they point at the same node
+        """
+        return (
+            isinstance(other, ArrayNode) and
+            self.linked_list is other.linked_list and
+            self.index == other.index
+        )
+
+    def __hash__(self):
+        """Hash of linked list and index, consistent with __eq__
+        """
+        return hash((id(self.linked_list), self.index))
+
+    @property
+    def data(self):
+        """any: Data in node, stored in linked list's values column"""
+        return self.linked_list.values[self.index]
+
+    @data.setter
+    def data(self, data):
+        self.linked_list.values[self.index] = data
+
+    @property
+    def next_node(self):
+        """ArrayNode: Next node in linked list, or None if this is the tail.
+        A new cursor is created on each access."""
+        next_index = self.linked_list.next_indices[self.index]
+        if next_index == NULL_INDEX:
+            return None
+        return ArrayNode(self.linked_list, next_index)
+
+    @next_node.setter
+    def next_node(self, node):
+        if node is None:
+            self.linked_list.next_indices[self.index] = NULL_INDEX
+        else:
+            self.linked_list.next_indices[self.index] = node.index
+
+
+class ArrayLinkedList():
+    """Class to represent a singly linked list, stored as a struct of arrays
+
+    Rather than a Python object per node, node i is stored as values[i] (its
+    data) and next_indices[i] (index of its next node), in two contiguous
+    columns. next_indices is an array of machine ints, and values can be too,
+    if a typecode is given, which uses a fraction of the memory of LinkedList.
+
+    Has the same head, next_node and data API as LinkedList, via ArrayNode,
+    so functions written for LinkedList run on it unchanged. Iterating over
+    the linked list directly walks the columns, without creating ArrayNodes.
+
+    Nodes that are unlinked are not reclaimed; they stay in the columns until
+    the linked list is deleted.
+    """
+
+    def __init__(self, input_arr=(), typecode=None):
+        """Initialise columns, from input_arr
+
+        Parameters
+        ----------
+        input_arr : iterable
+            Values to store in linked list, in order from head to tail
+        typecode : str
+            If given, values are stored in an array with this typecode (e.g.
+            'q' for 64 bit ints), rather than a list of Python objects
+        """
+        if typecode is None:
+            self.values = list(input_arr)
+        else:
+            self.values = array(typecode, input_arr)
+
+        self._link_in_order()
+
+    def _link_in_order(self):
+        """Link nodes in order of values column: node i links to node i + 1,
+        and last node links to nothing
+        """
+        num_nodes = len(self.values)
+        self.next_indices = array('q', range(1, num_nodes + 1))
+        if num_nodes > 0:
+            self.next_indices[-1] = NULL_INDEX
+            self.head_index = 0
+        else:
+            self.head_index = NULL_INDEX
+
+    @property
+    def head(self):
+        """ArrayNode: Head node of linked list, or None if it is empty"""
+        if self.head_index == NULL_INDEX:
+            return None
+        return ArrayNode(self, self.head_index)
+
+    @head.setter
+    def head(self, node):
+        if node is None:
+            self.head_index = NULL_INDEX
+        else:
+            self.head_index = node.index
+
+    def prepend(self, data):
+        """Add new node, containing data, to start of linked list
+
+        Parameters
+        ----------
+        data : any
+            Data to store in node
+        """
+        self.values.append(data)
+        self.next_indices.append(self.head_index)
+        self.head_index = len(self.values) - 1
+
+    def iter_indices(self):
+        """Iterate over indices of nodes in columns, from head to tail,
+        without creating ArrayNodes
+
+        Yields
+        ------
+        int
+            Index of each node
+        """
+        next_indices = self.next_indices
+        index = self.head_index
+        while index != NULL_INDEX:
+            yield index
+            index = next_indices[index]
+
+    def compact(self):
+        """Rewrite columns so they only contain nodes in linked list, in order
+        from head to tail, reclaiming slots of nodes that have been unlinked
+
+        Nodes move, so any ArrayNodes and indices of the linked list are
+        invalid afterwards.
+
+        Returns
+        -------
+        num_reclaimed : int
+            No. of slots reclaimed
+        """
+        values = self.values
+        if isinstance(values, array):
+            new_values = array(
+                values.typecode, (values[i] for i in self.iter_indices())
+            )
+        else:
+            new_values = [values[i] for i in self.iter_indices()]
+        num_reclaimed = len(values) - len(new_values)
+
+        self.values = new_values
+        self._link_in_order()
+
+        return num_reclaimed
+
+    def __iter__(self):
+        """Iterate over data in linked list, from head to tail
+
+        Yields
+        ------
+        any
+            Data in each node
+        """
+        values = self.values
+        next_indices = self.next_indices
+        index = self.head_index
+        while index != NULL_INDEX:
+            yield values[index]
+            index = next_indices[index]
+
+    def __str__(self):
+        """String of list of data in linked list, from head to tail
+        """
+        return str(list(self))
+
+
+def benchmark_ArrayLinkedList(num_nodes=1000000):
+    """Print memory used by, and time taken to traverse, ArrayLinkedList,
+    compared with LinkedList
+
+    Parameters
+    ----------
+    num_nodes : int
+        No. of nodes in each linked list
+    """
+    from data_structures.linked_lists.singly_linked_list import LinkedList
+
+    def traverse_nodes(linked_list):
+        current_node = linked_list.head
+        while current_node is not None:
+            current_node = current_node.next_node
+
+    constructors = {
+        'LinkedList': lambda: LinkedList(input_arr=range(num_nodes)),
+        'ArrayLinkedList': lambda: ArrayLinkedList(range(num_nodes)),
+        "ArrayLinkedList('q')": lambda: ArrayLinkedList(
+            range(num_nodes), typecode='q'
+        ),
+    }
+
+    print('{:,} nodes'.format(num_nodes))
+    for name, constructor in constructors.items():
+        tracemalloc.start()
+        linked_list = constructor()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        traverse_nodes(linked_list)
+        nodes_time = time.perf_counter() - start
+
+        print('    {:<22} {:>6.1f} bytes/node, head to tail: {:.3f}s'.format(
+            name + ':', memory / num_nodes, nodes_time
+        ), end='')
+
+        if isinstance(linked_list, ArrayLinkedList):
+            start = time.perf_counter()
+            for _ in linked_list:
+                pass
+            print(' (iterating: {:.3f}s)'.format(
+                time.perf_counter() - start
+            ))
+        else:
+            print()
+
+
+class Test(unittest.TestCase):
+    """Test cases"""
+
+    def test_ArrayLinkedList(self):
+        for typecode in [None, 'q']:
+            linked_list = ArrayLinkedList([1, 2, 3], typecode=typecode)
+            self.assertEqual(list(linked_list), [1, 2, 3])
+
+            # Test node API
+            node = linked_list.head
+            self.assertEqual(node.data, 1)
+            self.assertEqual(node.next_node.next_node.data, 3)
+            self.assertIsNone(node.next_node.next_node.next_node)
+            self.assertEqual(node.next_node, linked_list.head.next_node)
+            self.assertNotEqual(node, node.next_node)
+
+            # Test updating nodes
+            node.next_node = node.next_node.next_node
+            node.data = 4
+            linked_list.prepend(5)
+            self.assertEqual(list(linked_list), [5, 4, 3])
+            linked_list.head.next_node.next_node = None
+            self.assertEqual(list(linked_list), [5, 4])
+
+        # Test empty linked list
+        linked_list = ArrayLinkedList()
+        self.assertIsNone(linked_list.head)
+        linked_list.prepend('a')
+        self.assertEqual(list(linked_list), ['a'])
+        linked_list.head = None
+        self.assertEqual(list(linked_list), [])
+
+    def test_iter_indices(self):
+        linked_list = ArrayLinkedList([1, 2, 3])
+        linked_list.prepend(0)
+        self.assertEqual(list(linked_list.iter_indices()), [3, 0, 1, 2])
+        self.assertEqual(list(ArrayLinkedList().iter_indices()), [])
+
+    def test_compact(self):
+        for typecode in [None, 'q']:
+            linked_list = ArrayLinkedList([1, 2, 3, 4], typecode=typecode)
+            linked_list.prepend(0)
+            # Unlink 2 and 4
+            node = linked_list.head.next_node
+            node.next_node = node.next_node.next_node
+            node.next_node.next_node = None
+
+            self.assertEqual(linked_list.compact(), 2)
+            self.assertEqual(list(linked_list), [0, 1, 3])
+            self.assertEqual(len(linked_list.values), 3)
+            self.assertEqual(list(linked_list.iter_indices()), [0, 1, 2])
+            self.assertEqual(linked_list.compact(), 0)
+
+        linked_list = ArrayLinkedList([1])
+        linked_list.head = None
+        self.assertEqual(linked_list.compact(), 1)
+        self.assertIsNone(linked_list.head)
+
+
+if __name__ == '__main__':
+
+    if '--benchmark' in sys.argv:
+        benchmark_ArrayLinkedList()
+    else:
+        unittest.main()
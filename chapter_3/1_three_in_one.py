@@ -0,0 +1,486 @@
+import sys
+import time
+import tracemalloc
+import unittest
+from array import array
+
+from data_structures.stacks_and_queues.stack import Stack
+
+
+class MultiStack():
+    """Class to store many stacks in a single, preallocated array
+
+    Each stack has a region of the array: stack i's elements are stored in
+    buffer[starts[i]: starts[i] + sizes[i]], with room to grow up to
+    capacities[i] elements. Per-stack info is also stored in arrays, so there
+    are no objects per stack, or per element.
+
+    Divisions between regions are flexible: if a stack is full, all spare
+    capacity is redistributed between stacks in one pass, using Garwick's
+    algorithm (Knuth, TAOCP Vol. 1, 2.2.2): 10% is shared evenly, and 90% in
+    proportion to how much each stack has grown since the last
+    redistribution, so stacks that are growing fastest get the most room. If
+    the array is more than half full, it is doubled in size first. So a
+    redistribution, which costs O(size of array), only happens after O(size
+    of array) pushes, and pushes are amortised O(1) time, however skewed
+    they are between stacks.
+    """
+
+    def __init__(self, num_stacks=3, stack_capacity=4, typecode='q'):
+        """Allocate array, and split it evenly between stacks
+
+        Parameters
+        ----------
+        num_stacks : int
+            No. of stacks to store
+        stack_capacity : int
+            Initial capacity of each stack
+        typecode : str
+            Typecode of array to store elements in (e.g. 'q' for 64 bit ints).
+            If None, a list is used, so any Python object can be stored.
+        """
+        self.num_stacks = num_stacks
+        self.typecode = typecode
+        self.buffer = self._allocate(num_stacks * stack_capacity)
+
+        self.starts = array(
+            'q', [i * stack_capacity for i in range(num_stacks)]
+        )
+        self.sizes = array('q', [0] * num_stacks)
+        self.capacities = array('q', [stack_capacity] * num_stacks)
+        # Sizes of stacks at last redistribution, to find growth since then
+        self.prev_sizes = array('q', [0] * num_stacks)
+
+    def _allocate(self, size):
+        """Allocate buffer of given size
+
+        Parameters
+        ----------
+        size : int
+            No. of elements buffer can hold
+
+        Returns
+        -------
+        array or list
+            Buffer, filled with zeros (or None, for a list)
+        """
+        if self.typecode is None:
+            return [None] * size
+        return array(self.typecode, [0]) * size
+
+    def _new_capacities(self, stack_index, new_length):
+        """Split capacity of buffer between stacks, using Garwick's algorithm
+
+        Parameters
+        ----------
+        stack_index : int
+            Index of full stack, which gets at least one extra slot
+        new_length : int
+            Size of buffer; more than total size of stacks
+
+        Returns
+        -------
+        capacities : list of int
+            New capacity of each stack
+        """
+        num_stacks = self.num_stacks
+        # Count element about to be pushed as growth of full stack
+        growths = [
+            max(size - prev_size, 0)
+            for size, prev_size in zip(self.sizes, self.prev_sizes)
+        ]
+        growths[stack_index] += 1
+        total_growth = sum(growths)
+
+        # Reserve a slot for the full stack, so it always gets one
+        capacities = list(self.sizes)
+        capacities[stack_index] += 1
+        spare_capacity = new_length - sum(capacities)
+
+        even_share = spare_capacity // 10 // num_stacks
+        growth_spare = spare_capacity - even_share * num_stacks
+        for i in range(num_stacks):
+            capacities[i] += (
+                even_share + growth_spare * growths[i] // total_growth
+            )
+
+        # Give any slots left over from rounding down to the full stack
+        capacities[stack_index] += new_length - sum(capacities)
+
+        return capacities
+
+    def _make_room(self, stack_index):
+        """Redistribute spare capacity between stacks, so full stack has room
+        for another element, doubling size of buffer first if it is more than
+        half full
+
+        Parameters
+        ----------
+        stack_index : int
+            Index of full stack
+        """
+        total_size = sum(self.sizes)
+        new_length = len(self.buffer)
+        if new_length - total_size < total_size + self.num_stacks:
+            new_length = max(
+                2 * new_length, 2 * (total_size + self.num_stacks)
+            )
+            self.buffer.extend(
+                self._allocate(new_length - len(self.buffer))
+            )
+
+        capacities = self._new_capacities(stack_index, new_length)
+        new_starts = [0] * self.num_stacks
+        for i in range(1, self.num_stacks):
+            new_starts[i] = new_starts[i - 1] + capacities[i - 1]
+
+        # Move stacks in place. Stacks moving left are moved in order from
+        # left to right, and stacks moving right from right to left, so no
+        # stack is overwritten before it is moved.
+        moves = [i for i in range(self.num_stacks)
+                 if new_starts[i] < self.starts[i]]
+        moves += [i for i in range(self.num_stacks - 1, -1, -1)
+                  if new_starts[i] > self.starts[i]]
+        for i in moves:
+            start = self.starts[i]
+            size = self.sizes[i]
+            self.buffer[new_starts[i]: new_starts[i] + size] = (
+                self.buffer[start: start + size]
+            )
+
+        self.starts = array('q', new_starts)
+        self.capacities = array('q', capacities)
+        self.prev_sizes = array('q', self.sizes)
+
+        # Clear slots outside stacks, so a list buffer doesn't keep
+        # references to elements left behind by moves
+        if self.typecode is None:
+            for i in range(self.num_stacks):
+                start = self.starts[i] + self.sizes[i]
+                end = self.starts[i] + self.capacities[i]
+                self.buffer[start: end] = [None] * (end - start)
+
+    def push(self, stack_index, data):
+        """Add item (data) to top of stack at stack_index
+
+        Parameters
+        ----------
+        stack_index : int
+            Index of stack to push to
+        data
+            Data to store in stack
+        """
+        if self.sizes[stack_index] == self.capacities[stack_index]:
+            self._make_room(stack_index)
+
+        self.buffer[self.starts[stack_index] + self.sizes[stack_index]] = data
+        self.sizes[stack_index] += 1
+
+    def pop(self, stack_index):
+        """Remove and return the top item from stack at stack_index
+
+        Parameters
+        ----------
+        stack_index : int
+            Index of stack to pop from
+
+        Returns
+        -------
+            Data at top of stack
+        """
+        data = self.peek(stack_index)
+        self.sizes[stack_index] -= 1
+
+        # Clear slot, so a list buffer doesn't keep a reference to data
+        if self.typecode is None:
+            self.buffer[
+                self.starts[stack_index] + self.sizes[stack_index]
+            ] = None
+
+        return data
+
+    def peek(self, stack_index):
+        """Return the top item from stack at stack_index, without removing
+        it
+
+        Parameters
+        ----------
+        stack_index : int
+            Index of stack to peek at
+
+        Returns
+        -------
+            Data at top of stack
+        """
+        if self.sizes[stack_index] == 0:
+            raise Exception('Stack {} is empty.'.format(stack_index))
+
+        return self.buffer[
+            self.starts[stack_index] + self.sizes[stack_index] - 1
+        ]
+
+    def is_empty(self, stack_index):
+        """Check if stack at stack_index is empty
+
+        Parameters
+        ----------
+        stack_index : int
+            Index of stack to check
+
+        Returns
+        -------
+        bool
+            True if stack is empty, False otherwise
+        """
+        return self.sizes[stack_index] == 0
+
+    def stack(self, stack_index):
+        """Get a view of one stack, with the same API as Stack
+
+        Parameters
+        ----------
+        stack_index : int
+            Index of stack
+
+        Returns
+        -------
+        MultiStackView
+            View of stack at stack_index
+        """
+        return MultiStackView(self, stack_index)
+
+
+class MultiStackView():
+    """Class to represent a single stack in a MultiStack, with the same push,
+    pop, peek and is_empty methods as Stack
+    """
+
+    __slots__ = ('multi_stack', 'stack_index')
+
+    def __init__(self, multi_stack, stack_index):
+        """Input values
+
+        Parameters
+        ----------
+        multi_stack : MultiStack
+            MultiStack that stack is stored in
+        stack_index : int
+            Index of stack in multi_stack
+        """
+        self.multi_stack = multi_stack
+        self.stack_index = stack_index
+
+    def push(self, data):
+        """Add item (data) to top of stack
+
+        Parameters
+        ----------
+        data
+            Data to store in stack
+        """
+        self.multi_stack.push(self.stack_index, data)
+
+    def pop(self):
+        """Remove and return the top item from stack
+
+        Returns
+        -------
+            Data at top of stack
+        """
+        return self.multi_stack.pop(self.stack_index)
+
+    def peek(self):
+        """Return the top item from stack, without removing it
+
+        Returns
+        -------
+            Data at top of stack
+        """
+        return self.multi_stack.peek(self.stack_index)
+
+    def is_empty(self):
+        """Check if stack is empty
+
+        Returns
+        -------
+        bool
+            True if stack is empty, False otherwise
+        """
+        return self.multi_stack.is_empty(self.stack_index)
+
+
+def benchmark_MultiStack(num_stacks=10000, stack_size=10):
+    """Print memory used by MultiStack, compared with separate Stacks, and
+    time taken to push all elements
+
+    Parameters
+    ----------
+    num_stacks : int
+        No. of stacks
+    stack_size : int
+        No. of elements pushed to each stack
+    """
+    def fill_stacks():
+        stacks = [Stack() for _ in range(num_stacks)]
+        for i in range(stack_size):
+            for stack in stacks:
+                stack.push(i)
+        return stacks
+
+    def fill_multi_stack():
+        multi_stack = MultiStack(num_stacks, stack_capacity=1)
+        for i in range(stack_size):
+            for stack_index in range(num_stacks):
+                multi_stack.push(stack_index, i)
+        return multi_stack
+
+    print('{:,} stacks of {} elements'.format(num_stacks, stack_size))
+    fills = [('Stack', fill_stacks), ('MultiStack', fill_multi_stack)]
+    for name, fill in fills:
+        tracemalloc.start()
+        start = time.perf_counter()
+        stacks = fill()
+        fill_time = time.perf_counter() - start
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del stacks
+
+        print('    {:<12} {:>10,.0f} bytes, {:.2f} bytes/element, {:.3f}s'
+              .format(name + ':', memory,
+                      memory / (num_stacks * stack_size), fill_time))
+
+
+def benchmark_MultiStack_skewed(stack_counts=(1000, 2000, 4000),
+                                pushes_per_stack=4):
+    """Print time taken to push all elements onto a single stack of a
+    MultiStack, compared with a Stack, for various no. of stacks. Time per
+    push should not grow with no. of stacks.
+
+    Parameters
+    ----------
+    stack_counts : iterable of int
+        No. of stacks in each MultiStack
+    pushes_per_stack : int
+        No. of elements pushed onto one stack, per stack in MultiStack
+    """
+    print('Skewed workload: all pushes onto stack 0')
+    for num_stacks in stack_counts:
+        num_pushes = num_stacks * pushes_per_stack
+
+        stack = Stack()
+        start = time.perf_counter()
+        for i in range(num_pushes):
+            stack.push(i)
+        stack_time = time.perf_counter() - start
+
+        multi_stack = MultiStack(num_stacks, stack_capacity=1)
+        start = time.perf_counter()
+        for i in range(num_pushes):
+            multi_stack.push(0, i)
+        multi_stack_time = time.perf_counter() - start
+
+        print('    {:,} stacks, {:,} pushes: Stack {:.3f}s, MultiStack {:.3f}s'
+              .format(num_stacks, num_pushes, stack_time, multi_stack_time))
+
+
+class Test(unittest.TestCase):
+    """Test cases"""
+
+    def test_MultiStack(self):
+        for typecode in ['q', None]:
+            s = MultiStack(3, stack_capacity=2, typecode=typecode)
+
+            # Test empty stacks
+            for i in range(3):
+                self.assertTrue(s.is_empty(i))
+                with self.assertRaises(Exception):
+                    s.pop(i)
+                with self.assertRaises(Exception):
+                    s.peek(i)
+
+            # Test pushing beyond initial capacity, so divisions move, and
+            # array grows
+            expected = [[], [], []]
+            for i, stack_index in enumerate([1, 1, 1, 0, 2, 2, 2, 2, 0, 1]):
+                s.push(stack_index, i)
+                expected[stack_index].append(i)
+            for _ in range(20):
+                s.push(0, -1)
+                expected[0].append(-1)
+
+            # Test popping all elements
+            for stack_index in [2, 0, 1]:
+                self.assertEqual(
+                    s.peek(stack_index), expected[stack_index][-1]
+                )
+                while expected[stack_index]:
+                    self.assertEqual(
+                        s.pop(stack_index), expected[stack_index].pop()
+                    )
+                self.assertTrue(s.is_empty(stack_index))
+
+    def test_MultiStack_redistributes_without_growing(self):
+        s = MultiStack(3, stack_capacity=4)
+        for i in range(5):
+            s.push(2, i)
+        self.assertEqual(len(s.buffer), 12)
+        self.assertEqual([s.pop(2) for _ in range(5)], [4, 3, 2, 1, 0])
+
+    def test_MultiStack_skewed(self):
+        # Push thousands of elements onto one stack of many
+        for typecode in ['q', None]:
+            s = MultiStack(100, stack_capacity=1, typecode=typecode)
+            for stack_index in range(100):
+                s.push(stack_index, -stack_index)
+            for i in range(5000):
+                s.push(7, i)
+
+            # Test buffer only grows by doubling, and stays in order
+            self.assertLessEqual(len(s.buffer), 4 * 5100)
+            for i in range(1, 100):
+                self.assertEqual(
+                    s.starts[i], s.starts[i - 1] + s.capacities[i - 1]
+                )
+
+            self.assertEqual(
+                [s.pop(7) for _ in range(5001)],
+                list(range(4999, -1, -1)) + [-7]
+            )
+            for stack_index in range(100):
+                if stack_index != 7:
+                    self.assertEqual(s.pop(stack_index), -stack_index)
+                self.assertTrue(s.is_empty(stack_index))
+
+    def test_MultiStack_releases_popped(self):
+        # Push to stack 0 until stack 1 is shifted both ways, then pop all
+        s = MultiStack(3, stack_capacity=2, typecode=None)
+        for i in range(4):
+            s.push(1, object())
+        for i in range(3):
+            s.push(0, object())
+        for stack_index in range(3):
+            while not s.is_empty(stack_index):
+                s.pop(stack_index)
+
+        # Test no references to popped elements are kept
+        self.assertEqual(s.buffer, [None] * len(s.buffer))
+
+    def test_MultiStackView(self):
+        s = MultiStack(2, stack_capacity=1)
+        stack = s.stack(1)
+        stack.push(5)
+        stack.push(6)
+        self.assertEqual(stack.peek(), 6)
+        self.assertEqual(stack.pop(), 6)
+        self.assertEqual(stack.pop(), 5)
+        self.assertTrue(stack.is_empty())
+        self.assertTrue(s.is_empty(0))
+
+
+if __name__ == '__main__':
+
+    if '--benchmark' in sys.argv:
+        benchmark_MultiStack()
+        benchmark_MultiStack_skewed()
+    else:
+        unittest.main()
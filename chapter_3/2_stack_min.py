@@ -1,4 +1,11 @@
+import collections
+import operator
+import random
+import sys
+import time
+import tracemalloc
 import unittest
+from array import array
 
 from data_structures.linked_lists.singly_linked_list import LinkedList
 from data_structures.stacks_and_queues.stack import Stack
@@ -29,6 +36,13 @@ class StackData():
 class StackMin(LinkedList):
     """Class to represent a stack data structure, with O(1) method for getting
     min value in stack.
+
+    push() and pop() only ever change which node is the head, and never
+    modify existing nodes, so the nodes below the head can be shared between
+    stacks. fork() and snapshot() use this to copy a stack in O(1) time.
+    Inherited LinkedList methods that modify nodes in place (e.g. append())
+    would change every stack sharing those nodes, so shouldn't be used on
+    forked stacks.
     """
 
     def get_min(self):
@@ -89,6 +103,195 @@ class StackMin(LinkedList):
 
         return data
 
+    def fork(self):
+        """Create a copy of stack in O(1) time, by sharing its nodes
+
+        Pushing to or popping from either stack afterwards doesn't affect the
+        other.
+
+        Returns
+        -------
+        StackMin
+            Stack containing the same elements
+        """
+        forked = type(self)()
+        forked.head = self.head
+        return forked
+
+    def snapshot(self):
+        """Create a read-only view of current state of stack in O(1) time, by
+        sharing its nodes
+
+        Returns
+        -------
+        StackMinSnapshot
+            View of stack, which is unaffected by later pushes and pops
+        """
+        return StackMinSnapshot(self.head)
+
+    def restore(self, snapshot):
+        """Reset stack to state it was in when snapshot was taken, in O(1)
+        time
+
+        Parameters
+        ----------
+        snapshot : StackMinSnapshot
+            Snapshot of a StackMin
+        """
+        self.head = snapshot.head
+
+
+class StackMinSnapshot():
+    """Class to represent a read-only view of a StackMin, at the time the
+    snapshot was taken
+
+    Just holds the head node of the stack, so the snapshot shares all its
+    nodes with the stack. E.g. for backtracking search, take a snapshot
+    before exploring a branch, then restore() it afterwards.
+    """
+
+    __slots__ = ('head',)
+
+    def __init__(self, head):
+        """Input values
+
+        Parameters
+        ----------
+        head : Node
+            Head node of stack, or None if stack is empty
+        """
+        self.head = head
+
+    def is_empty(self):
+        """Check if stack was empty
+
+        Returns
+        -------
+        bool
+            True if stack was empty, False otherwise
+        """
+        return self.head is None
+
+    def peek(self):
+        """Returns top item of stack
+
+        Returns
+        -------
+        any
+            Data at top of stack
+        """
+        if self.head is None:
+            raise Exception('StackMinSnapshot is empty.')
+
+        return self.head.data.data
+
+    def get_min(self):
+        """Returns min value in stack
+
+        Returns
+        -------
+        min_val : any
+            Minimum value of stack. Can be any Python object that allows
+            comparison.
+        """
+        if self.head is None:
+            raise Exception('StackMinSnapshot is empty.')
+
+        return self.head.data.min_val
+
+    def fork(self):
+        """Create a StackMin from snapshot in O(1) time, by sharing its nodes
+
+        Returns
+        -------
+        StackMin
+            Stack containing the elements of the snapshot
+        """
+        forked = StackMin()
+        forked.head = self.head
+        return forked
+
+
+class ValueRun():
+    """Class to represent a run of equal min (or max) values in StackMin2
+
+    Holds the value, and the no. of elements in the stack with that value,
+    since it last became the min. Only used for runs of 2 or more elements;
+    a run of 1 element is stored as the value itself, so a stack of distinct
+    min values costs no more than storing the values.
+    """
+
+    __slots__ = ('value', 'count')
+
+    def __init__(self, value, count=1):
+        """Input values
+
+        Parameters
+        ----------
+        value : any
+            Min (or max) value
+        count : int
+            No. of elements with this value
+        """
+        self.value = value
+        self.count = count
+
+
+def _run_value(run):
+    """Returns value of run in stack of runs
+
+    Parameters
+    ----------
+    run : ValueRun or any
+        Run of 2 or more elements, or value of run of 1 element
+
+    Returns
+    -------
+    any
+        Value of run
+    """
+    if isinstance(run, ValueRun):
+        return run.value
+    return run
+
+
+def _push_to_runs(runs, data):
+    """Update stack of runs, after data, which is equal to value of top run,
+    is pushed to stack it tracks
+
+    Parameters
+    ----------
+    runs : Stack
+        Stack of runs, as used by StackMin2
+    data : any
+        Data pushed to stack
+    """
+    run = runs.peek()
+    if isinstance(run, ValueRun):
+        run.count += 1
+    else:
+        runs.head.data = ValueRun(data, 2)
+
+
+def _pop_from_runs(runs, data):
+    """Update stack of runs, after data is popped from stack it tracks
+
+    Parameters
+    ----------
+    runs : Stack
+        Stack of runs, as used by StackMin2
+    data : any
+        Data popped from stack
+    """
+    run = runs.peek()
+    if isinstance(run, ValueRun):
+        if data == run.value:
+            run.count -= 1
+            if run.count == 1:
+                runs.head.data = run.value
+    elif data == run:
+        runs.pop()
+
 
 class StackMin2(Stack):
     """More efficient version of StackMin
@@ -98,9 +301,11 @@ class StackMin2(Stack):
     above it.
 
     Instead, use another stack to keep track of min value when it changes. Note
-    that adding another element with value equal to the current min value does
-    add to this stack, since otherwise removing this element would break
-    get_min() (this wasn't clear in book's solution).
+    that adding another element with value equal to the current min value must
+    be recorded, since otherwise removing this element would break get_min()
+    (this wasn't clear in book's solution). Rather than pushing the value
+    again, which doubles memory used if the min is repeated many times, a
+    repeated min value is stored as one ValueRun, counting the repeats.
     ^Above solution based on book's solution.
     """
 
@@ -123,7 +328,7 @@ class StackMin2(Stack):
             Minimum value of sub-stack. Can be any Python object that allows
             comparison.
         """
-        return self.min_vals.peek()
+        return _run_value(self.min_vals.peek())
 
     def push(self, data):
         """Add item (data) to top of stack (i.e. to head of Stack).
@@ -135,14 +340,11 @@ class StackMin2(Stack):
         data
             Data to store in stack.
         """
-        # Find exising min_val
         # Handle special case of empty stack
-        if self.head is None:
+        if self.head is None or data < self.get_min():
             self.min_vals.push(data)
-        else:
-            min_val = self.get_min()
-            if data <= min_val:
-                self.min_vals.push(data)
+        elif data == self.get_min():
+            _push_to_runs(self.min_vals, data)
 
         # Add data to stack
         self.prepend(data)
@@ -164,12 +366,538 @@ class StackMin2(Stack):
         self._delete_head()
 
         # Remove element from min_vals stack, if required
-        if data == self.min_vals.peek():
-            self.min_vals.pop()
+        _pop_from_runs(self.min_vals, data)
 
         return data
 
 
+class StackMinMax(StackMin2):
+    """StackMin2, with O(1) method for getting max value in stack too
+
+    Tracks runs of max values in another stack, in the same way as min
+    values.
+    """
+
+    def __init__(self):
+        """Initialise stack as is done for StackMin2, but also introduce stack
+        to track max values
+        """
+        super().__init__()
+
+        # Use this stack to track max vals
+        self.max_vals = Stack()
+
+    def get_max(self):
+        """Returns max value in stack
+
+        Returns
+        -------
+        max_val : any
+            Maximum value of sub-stack. Can be any Python object that allows
+            comparison.
+        """
+        return _run_value(self.max_vals.peek())
+
+    def push(self, data):
+        """Add item (data) to top of stack, updating max values, as well as
+        min values
+
+        Parameters
+        ----------
+        data
+            Data to store in stack.
+        """
+        if self.head is None or data > self.get_max():
+            self.max_vals.push(data)
+        elif data == self.get_max():
+            _push_to_runs(self.max_vals, data)
+
+        super().push(data)
+
+    def pop(self):
+        """Remove and return the top item from the stack, updating max values,
+        as well as min values
+
+        Returns
+        -------
+        any
+            Data at head of Stack. Can be any Python object that allows
+            comparison.
+        """
+        data = super().pop()
+
+        # Remove element from max_vals stack, if required
+        _pop_from_runs(self.max_vals, data)
+
+        return data
+
+
+class ArrayStackMin():
+    """Contiguous version of StackMin
+
+    Rather than wrapping each element in a StackData and a linked list node,
+    element i is stored as values[i], and the min of elements 0 to i as
+    mins[i], in two parallel columns, with the top of the stack at the end.
+    The columns are lists, or arrays if a typecode is given, which grow by
+    over-allocating, so push and pop are amortised O(1) time.
+    """
+
+    __slots__ = ('values', 'mins')
+
+    def __init__(self, typecode=None):
+        """Initialise empty columns
+
+        Parameters
+        ----------
+        typecode : str
+            If given, values and mins are stored in arrays with this typecode
+            (e.g. 'q' for 64 bit ints), rather than lists of Python objects
+        """
+        if typecode is None:
+            self.values = []
+            self.mins = []
+        else:
+            self.values = array(typecode)
+            self.mins = array(typecode)
+
+    def __len__(self):
+        """Returns no. of elements in stack
+
+        Returns
+        -------
+        int
+            No. of elements in stack
+        """
+        return len(self.values)
+
+    def is_empty(self):
+        """Check if stack is empty
+
+        Returns
+        -------
+        bool
+            True if stack is empty, False otherwise
+        """
+        return not self.values
+
+    def get_min(self):
+        """Returns min value in stack
+
+        Returns
+        -------
+        min_val : any
+            Minimum value of stack. Can be any Python object that allows
+            comparison.
+        """
+        if not self.mins:
+            raise Exception('ArrayStackMin is empty.')
+
+        return self.mins[-1]
+
+    def peek(self):
+        """Returns top item of stack, without removing it
+
+        Returns
+        -------
+        any
+            Data at top of stack
+        """
+        if not self.values:
+            raise Exception('ArrayStackMin is empty.')
+
+        return self.values[-1]
+
+    def push(self, data):
+        """Add item (data) to top of stack, along with min of stack
+
+        Parameters
+        ----------
+        data
+            Data to store in stack.
+        """
+        mins = self.mins
+        if mins and mins[-1] < data:
+            mins.append(mins[-1])
+        else:
+            mins.append(data)
+        self.values.append(data)
+
+    def pop(self):
+        """Remove and return the top item from the stack.
+
+        Returns
+        -------
+        any
+            Data at top of stack
+        """
+        if not self.values:
+            raise Exception('ArrayStackMin is empty.')
+
+        self.mins.pop()
+        return self.values.pop()
+
+
+class MinMaxQueue():
+    """Queue with O(1) methods for getting min and max value in queue
+
+    Implemented using 2 StackMinMax stacks, as in MyQueue: elements are added
+    to one stack, and removed from the other, moving all elements across only
+    when the remove stack is empty. So each operation is amortised O(1) time,
+    and min (or max) of queue is min (or max) of both stacks.
+    """
+
+    def __init__(self):
+        """Initialise add and remove stacks
+        """
+        self.add_stack = StackMinMax()
+        self.remove_stack = StackMinMax()
+
+    def is_empty(self):
+        """Check if queue is empty
+
+        Returns
+        -------
+        bool
+            True if queue is empty, False otherwise
+        """
+        return self.add_stack.is_empty() and self.remove_stack.is_empty()
+
+    def add(self, data):
+        """Add element to back of queue
+
+        Parameters
+        ----------
+        data : any
+            Data to store in queue. Can be any Python object that allows
+            comparison.
+        """
+        self.add_stack.push(data)
+
+    def remove(self):
+        """Remove element from front of queue
+
+        Returns
+        -------
+        data : any
+            Data at front of queue
+        """
+        if self.remove_stack.is_empty():
+            # Reverse order of elements, so front of queue is top of stack
+            while not self.add_stack.is_empty():
+                self.remove_stack.push(self.add_stack.pop())
+
+        return self.remove_stack.pop()
+
+    def _extreme(self, get_stack_extreme, choose):
+        """Find min or max of queue, from min or max of each stack
+
+        Parameters
+        ----------
+        get_stack_extreme : function
+            Takes a stack, and returns its min (or max)
+        choose : function
+            Either min or max
+
+        Returns
+        -------
+        any
+            Min or max value in queue
+        """
+        if self.is_empty():
+            raise Exception('MinMaxQueue is empty.')
+
+        return choose(
+            get_stack_extreme(stack)
+            for stack in [self.add_stack, self.remove_stack]
+            if not stack.is_empty()
+        )
+
+    def get_min(self):
+        """Returns min value in queue
+
+        Returns
+        -------
+        any
+            Minimum value in queue
+        """
+        return self._extreme(StackMinMax.get_min, min)
+
+    def get_max(self):
+        """Returns max value in queue
+
+        Returns
+        -------
+        any
+            Maximum value in queue
+        """
+        return self._extreme(StackMinMax.get_max, max)
+
+
+def _sliding_window_extreme(iterable, window_size, is_better):
+    """Find min or max of each window of window_size consecutive elements in
+    iterable, using a monotonic deque
+
+    Deque holds (index, value) of elements that could still be the extreme
+    of a future window: each is better than all elements after it. So the
+    front is the extreme of current window, and each element is added and
+    removed at most once, so amortised O(1) time per element.
+
+    Parameters
+    ----------
+    iterable : iterable of any
+        Elements to process. Can be any Python objects that allow comparison.
+    window_size : int
+        No. of elements in each window
+    is_better : function
+        Takes 2 values, and returns True if first is strictly better (i.e.
+        smaller, for min) than second
+
+    Yields
+    ------
+    any
+        Min or max of each full window, in order
+    """
+    candidates = collections.deque()
+    for index, value in enumerate(iterable):
+        # Remove candidates that can no longer be the extreme, since value
+        # is at least as good, and stays in windows for longer
+        while candidates and not is_better(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((index, value))
+
+        # Remove front candidate, if it has left window
+        if candidates[0][0] <= index - window_size:
+            candidates.popleft()
+
+        # Yield once window is full
+        if index >= window_size - 1:
+            yield candidates[0][1]
+
+
+def sliding_window_min(iterable, window_size):
+    """Find min of each window of window_size consecutive elements in
+    iterable, in amortised O(1) time per element.
+
+    Not a generator itself, so window_size is validated when this is called,
+    rather than when the generator returned is first iterated over.
+
+    Parameters
+    ----------
+    iterable : iterable of any
+        Elements to process. Can be any Python objects that allow comparison.
+    window_size : int
+        No. of elements in each window
+
+    Returns
+    -------
+    generator of any
+        Yields min of each full window, in order
+    """
+    if window_size < 1:
+        raise Exception('window_size must be at least 1')
+
+    return _sliding_window_extreme(iterable, window_size, operator.lt)
+
+
+def sliding_window_max(iterable, window_size):
+    """Same as sliding_window_min, but for max of each window.
+    """
+    if window_size < 1:
+        raise Exception('window_size must be at least 1')
+
+    return _sliding_window_extreme(iterable, window_size, operator.gt)
+
+
+def benchmark_sliding_window_min(size=100000, window_size=100):
+    """Print time taken to find min of each window of a time series, by
+    sliding_window_min and MinMaxQueue, compared with calling min() on each
+    window
+
+    Parameters
+    ----------
+    size : int
+        No. of elements in time series
+    window_size : int
+        No. of elements in each window
+    """
+    values = [random.random() for _ in range(size)]
+
+    def recompute_min(values, window_size):
+        return [
+            min(values[i: i + window_size])
+            for i in range(len(values) - window_size + 1)
+        ]
+
+    def min_max_queue(values, window_size):
+        queue = MinMaxQueue()
+        mins = []
+        for i, value in enumerate(values):
+            queue.add(value)
+            if i >= window_size:
+                queue.remove()
+            if i >= window_size - 1:
+                mins.append(queue.get_min())
+        return mins
+
+    def deque(values, window_size):
+        return list(sliding_window_min(values, window_size))
+
+    print('{:,} elements, window size {}'.format(size, window_size))
+    for name, function in [('min() per window', recompute_min),
+                           ('MinMaxQueue', min_max_queue),
+                           ('sliding_window_min', deque)]:
+        start = time.perf_counter()
+        function(values, window_size)
+        print('    {:<20} {:.3f}s'.format(
+            name + ':', time.perf_counter() - start
+        ))
+
+
+def benchmark_StackMin2_memory(size=1000000):
+    """Print memory used by StackMin and StackMin2, and no. of elements in
+    StackMin2's min_vals stack, for workloads that repeat the min value, and
+    that decrease (so every value is a new min)
+
+    Parameters
+    ----------
+    size : int
+        No. of elements pushed onto each stack
+    """
+    workloads = {
+        'constant': [0] * size,
+        'decreasing': list(range(size, 0, -1)),
+    }
+
+    print('{:,} elements'.format(size))
+    for workload_name, values in workloads.items():
+        print('    {} workload:'.format(workload_name))
+        for stack_class in [StackMin, StackMin2]:
+            tracemalloc.start()
+            stack = stack_class()
+            for data in values:
+                stack.push(data)
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            if hasattr(stack, 'min_vals'):
+                num_runs = 0
+                run_node = stack.min_vals.head
+                while run_node is not None:
+                    num_runs += 1
+                    run_node = run_node.next_node
+                runs_info = ', {:,} min_vals entries'.format(num_runs)
+            else:
+                runs_info = ''
+
+            print('        {:<10} {:>6.1f} bytes/element{}'.format(
+                stack_class.__name__ + ':', memory / size, runs_info
+            ))
+            del stack
+
+
+def benchmark_ArrayStackMin(size=1000000):
+    """Print memory used by, and time taken to push and pop elements onto,
+    ArrayStackMin, compared with StackMin and StackMin2
+
+    Parameters
+    ----------
+    size : int
+        No. of elements pushed onto, then popped from, each stack
+    """
+    values = [random.randrange(size) for _ in range(size)]
+
+    constructors = {
+        'StackMin': StackMin,
+        'StackMin2': StackMin2,
+        'ArrayStackMin': ArrayStackMin,
+        "ArrayStackMin('q')": lambda: ArrayStackMin(typecode='q'),
+    }
+
+    print('{:,} random elements'.format(size))
+    for name, constructor in constructors.items():
+        # Measure memory and time in separate runs, since tracing memory
+        # slows down allocation
+        tracemalloc.start()
+        stack = constructor()
+        for data in values:
+            stack.push(data)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del stack
+
+        stack = constructor()
+        start = time.perf_counter()
+        for data in values:
+            stack.push(data)
+        push_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(size):
+            stack.pop()
+        pop_time = time.perf_counter() - start
+
+        print(
+            '    {:<20} {:>6.1f} bytes/element, '
+            '{:>5.2f}M pushes/s, {:>5.2f}M pops/s'.format(
+                name + ':', memory / size,
+                size / push_time / 1e6, size / pop_time / 1e6
+            )
+        )
+
+
+def benchmark_StackMin_fork(num_forks=1000000, size=1000, num_copies=1000):
+    """Print time taken and memory used to fork a StackMin, compared with
+    copying it by pushing its elements onto a new StackMin
+
+    Parameters
+    ----------
+    num_forks : int
+        No. of times to fork stack
+    size : int
+        No. of elements in stack
+    num_copies : int
+        No. of times to copy stack, which is much slower than forking
+    """
+    stack = StackMin()
+    for data in range(size, 0, -1):
+        stack.push(data)
+
+    def copy_stack(stack):
+        elements = []
+        current_node = stack.head
+        while current_node is not None:
+            elements.append(current_node.data.data)
+            current_node = current_node.next_node
+
+        copied = StackMin()
+        for data in reversed(elements):
+            copied.push(data)
+        return copied
+
+    print('Stack of {:,} elements'.format(size))
+    for name, copy_function, num_times in [
+            ('fork()', StackMin.fork, num_forks),
+            ('snapshot()', StackMin.snapshot, num_forks),
+            ('copy', copy_stack, num_copies)]:
+        # Keep copies alive, to measure memory used by them
+        tracemalloc.start()
+        copies = [copy_function(stack) for _ in range(num_copies)]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del copies
+
+        start = time.perf_counter()
+        for _ in range(num_times):
+            copy_function(stack)
+        total_time = time.perf_counter() - start
+
+        print('    {:<12} {:,} times: {:.3f}s ({:.2f}us, {:,.0f} bytes '
+              'each)'.format(
+                  name, num_times, total_time,
+                  total_time / num_times * 1e6, memory / num_copies
+              ))
+
+
 class Test(unittest.TestCase):
     """Test cases"""
     # Define test case inputs, and expected outputs
@@ -217,10 +945,155 @@ class Test(unittest.TestCase):
     def test_StackMin(self):
         self._test_helper(StackMin)
 
+    def test_StackMin_fork(self):
+        s = StackMin()
+        for data in [5, 3, 8]:
+            s.push(data)
+
+        # Test forked stacks don't affect each other
+        forked = s.fork()
+        self.assertIs(forked.head, s.head)
+        forked.push(1)
+        self.assertEqual(forked.get_min(), 1)
+        self.assertEqual(s.get_min(), 3)
+        self.assertEqual(s.pop(), 8)
+        self.assertEqual(s.pop(), 3)
+        self.assertEqual(s.get_min(), 5)
+        self.assertEqual([forked.pop() for _ in range(4)], [1, 8, 3, 5])
+        self.assertIsNone(forked.head)
+        self.assertEqual(s.pop(), 5)
+
+        # Test snapshot and restore, as for backtracking
+        s.push(4)
+        snapshot = s.snapshot()
+        s.push(2)
+        s.pop()
+        s.pop()
+        s.push(6)
+        self.assertEqual(snapshot.peek(), 4)
+        self.assertEqual(snapshot.get_min(), 4)
+        s.restore(snapshot)
+        self.assertEqual(s.pop(), 4)
+        self.assertTrue(s.snapshot().is_empty())
+        with self.assertRaises(Exception):
+            s.snapshot().get_min()
+
+        # Test forking snapshot
+        forked = snapshot.fork()
+        forked.push(7)
+        self.assertEqual(snapshot.peek(), 4)
+        self.assertEqual(forked.pop(), 7)
+        self.assertEqual(forked.pop(), 4)
+
     def test_StackMin2(self):
         self._test_helper(StackMin2)
 
+    def test_ArrayStackMin(self):
+        self._test_helper(ArrayStackMin)
+        self._test_helper(lambda: ArrayStackMin(typecode='q'))
+
+        s = ArrayStackMin(typecode='q')
+        for data in [5, 3, 3, 8, 1]:
+            s.push(data)
+        self.assertEqual(len(s), 5)
+        self.assertEqual(s.peek(), 1)
+        self.assertEqual([s.pop() for _ in range(3)], [1, 8, 3])
+        self.assertEqual(s.get_min(), 3)
+        s.pop()
+        self.assertEqual(s.get_min(), 5)
+        s.pop()
+        self.assertTrue(s.is_empty())
+
+    def test_StackMinMax(self):
+        self._test_helper(StackMinMax)
+
+        s = StackMinMax()
+        for data in [3, 7, 7, 1, 9]:
+            s.push(data)
+        self.assertEqual(s.get_max(), 9)
+        self.assertEqual(s.pop(), 9)
+        self.assertEqual(s.get_max(), 7)
+        self.assertEqual(s.pop(), 1)
+        self.assertEqual(s.pop(), 7)
+        self.assertEqual(s.get_max(), 7)
+
+    def test_min_vals_runs(self):
+        s = StackMin2()
+
+        # Test repeated min values are stored as one run
+        for data in [5, 2, 2, 2, 3, 2]:
+            s.push(data)
+        self.assertEqual(s.min_vals.peek().value, 2)
+        self.assertEqual(s.min_vals.peek().count, 4)
+        self.assertIsNone(s.min_vals.head.next_node.next_node)
+
+        # Test run is removed once all its elements are popped
+        for _ in range(4):
+            s.pop()
+            self.assertEqual(s.get_min(), 2)
+        self.assertEqual(s.min_vals.peek(), 2)
+        s.pop()
+        self.assertEqual(s.get_min(), 5)
+        self.assertIsNone(s.min_vals.head.next_node)
+
+        # Test distinct min values aren't wrapped in runs
+        for data in [4, 3]:
+            s.push(data)
+        self.assertEqual(s.min_vals.peek(), 3)
+
+    def test_MinMaxQueue(self):
+        q = MinMaxQueue()
+
+        # Test empty queue
+        with self.assertRaises(Exception):
+            q.get_min()
+        with self.assertRaises(Exception):
+            q.remove()
+
+        # Test against min and max of list used as a queue
+        values = [5, 3, 8, 3, 1, 9, 2, 7, 7, 4]
+        expected = []
+        for i, data in enumerate(values):
+            q.add(data)
+            expected.append(data)
+            if i % 3 == 2:
+                self.assertEqual(q.remove(), expected.pop(0))
+            self.assertEqual(q.get_min(), min(expected))
+            self.assertEqual(q.get_max(), max(expected))
+
+    def test_sliding_window(self):
+        values = [5, 3, 8, 3, 1, 9, 2, 7, 7, 4]
+        for window_size in [1, 3, 10]:
+            windows = [
+                values[i: i + window_size]
+                for i in range(len(values) - window_size + 1)
+            ]
+            self.assertEqual(
+                list(sliding_window_min(iter(values), window_size)),
+                [min(window) for window in windows]
+            )
+            self.assertEqual(
+                list(sliding_window_max(iter(values), window_size)),
+                [max(window) for window in windows]
+            )
+
+        # Test window bigger than iterable
+        self.assertEqual(list(sliding_window_min(values, 11)), [])
+
+        # Test invalid window_size is rejected before iterating
+        for window_size in [0, -1]:
+            with self.assertRaises(Exception):
+                sliding_window_min(values, window_size)
+            with self.assertRaises(Exception):
+                sliding_window_max(values, window_size)
+
 
 if __name__ == '__main__':
 
-    unittest.main()
+    if '--benchmark' in sys.argv:
+        benchmark_sliding_window_min()
+        benchmark_StackMin2_memory()
+        benchmark_ArrayStackMin()
+        benchmark_StackMin_fork()
+    else:
+        unittest.main()